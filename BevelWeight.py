@@ -36,11 +36,14 @@ class QP_OT_BevelWeight(Operator):
     initial_weight = 0.0
     initial_mouse_x = 0
     obj = None
+    mesh = None
     bm = None
-    selected_vert_indices = []
-    selected_edge_indices = []
+    bw_layer = None  # BMesh float layer holding the bevel weight attribute
+    cached_elems = []  # Selected BMVert/BMEdge objects for the active mode
     active_mode = 'EDGE'  # Will be set to VERT or EDGE based on selection
     bevel_modifier = None  # Store the associated bevel modifier
+    _timer = None  # Coalesces mouse-driven mesh updates to at most 60 Hz
+    _dirty = False  # Weight changed since the last mesh update
 
     @classmethod
     def poll(cls, context):
@@ -48,16 +51,6 @@ class QP_OT_BevelWeight(Operator):
 
     def invoke(self, context, event):
         self.obj = context.active_object
-        mesh = self.obj.data
-        
-        # Get BMesh to find selected elements
-        self.bm = bmesh.from_edit_mesh(mesh)
-        self.bm.verts.ensure_lookup_table()
-        self.bm.edges.ensure_lookup_table()
-        
-        # Store indices of selected vertices and edges
-        self.selected_vert_indices = [vert.index for vert in self.bm.verts if vert.select]
-        self.selected_edge_indices = [edge.index for edge in self.bm.edges if edge.select]
         
         # Determine which mode to use based on current edit mode
         current_mode = context.tool_settings.mesh_select_mode[:]
@@ -66,38 +59,16 @@ class QP_OT_BevelWeight(Operator):
         else:
             # Edge or Face mode (both use edge bevel weights)
             self.active_mode = 'EDGE'
-            
-        # Check if we have a valid selection based on the active mode
-        if self.active_mode == 'VERT':
-            if not self.selected_vert_indices:
-                self.report({'WARNING'}, "No vertices selected")
-                return {'CANCELLED'}
-        else:  # EDGE mode
-            if not self.selected_edge_indices:
-                self.report({'WARNING'}, "No edges selected")
-                return {'CANCELLED'}
-        
-        # Ensure the appropriate attribute exists
-        attr_name = "bevel_weight_vert" if self.active_mode == 'VERT' else "bevel_weight_edge"
-        domain = 'POINT' if self.active_mode == 'VERT' else 'EDGE'
         
-        if attr_name not in mesh.attributes:
-            mesh.attributes.new(name=attr_name, type='FLOAT', domain=domain)
+        self.cache_selection()
         
-        # We need to briefly switch to object mode to sample the attribute
-        bpy.ops.object.mode_set(mode='OBJECT')
-        
-        # Get the initial weight
-        attr = mesh.attributes[attr_name]
-        indices = self.selected_vert_indices if self.active_mode == 'VERT' else self.selected_edge_indices
+        # Check if we have a valid selection based on the active mode
+        if not self.cached_elems:
+            self.report({'WARNING'}, "No vertices selected" if self.active_mode == 'VERT' else "No edges selected")
+            return {'CANCELLED'}
         
-        if len(attr.data) > 0 and indices:
-            self.initial_weight = attr.data[indices[0]].value
-        else:
-            self.initial_weight = 0.0
-            
-        # Switch back to edit mode
-        bpy.ops.object.mode_set(mode='EDIT')
+        # Sample the initial weight directly from the live BMesh layer
+        self.initial_weight = self.cached_elems[0][self.bw_layer]
         
         self.weight = self.initial_weight
         self.initial_mouse_x = event.mouse_x
@@ -119,30 +90,43 @@ class QP_OT_BevelWeight(Operator):
         self.update_bevel_weight(context)
         
         # Begin modal operation
+        self._dirty = False
+        self._timer = context.window_manager.event_timer_add(1 / 60, window=context.window)
         context.window_manager.modal_handler_add(self)
         return {'RUNNING_MODAL'}
     
-    def update_bevel_weight(self, context):
-        mesh = self.obj.data
+    def cache_selection(self):
+        """Bind the edit-mode BMesh and cache the selected elements and bevel weight layer
         
-        # We need to switch to object mode to update attributes
-        bpy.ops.object.mode_set(mode='OBJECT')
-        
-        # Update the appropriate attribute
-        attr_name = "bevel_weight_vert" if self.active_mode == 'VERT' else "bevel_weight_edge"
-        attr = mesh.attributes[attr_name]
+        Bevel weights live in the "bevel_weight_vert"/"bevel_weight_edge" float
+        attributes, which are exposed as float layers on the edit-mode BMesh.
+        Writing to the layer directly avoids leaving edit mode.
+        """
+        self.mesh = self.obj.data
+        self.bm = bmesh.from_edit_mesh(self.mesh)
         
-        indices = self.selected_vert_indices if self.active_mode == 'VERT' else self.selected_edge_indices
-        for idx in indices:
-            if idx < len(attr.data):
-                attr.data[idx].value = self.weight
+        if self.active_mode == 'VERT':
+            attr_name = "bevel_weight_vert"
+            elems = self.bm.verts
+        else:
+            attr_name = "bevel_weight_edge"
+            elems = self.bm.edges
         
-        # Switch back to edit mode
-        bpy.ops.object.mode_set(mode='EDIT')
+        self.bw_layer = elems.layers.float.get(attr_name)
+        if self.bw_layer is None:
+            self.bw_layer = elems.layers.float.new(attr_name)
+        self.cached_elems = [elem for elem in elems if elem.select]
+    
+    def update_bevel_weight(self, context):
+        # Write straight into the BMesh layer - no mode switch needed.
+        # Read the weight property once instead of once per element.
+        bw_layer = self.bw_layer
+        weight = self.weight
+        for elem in self.cached_elems:
+            elem[bw_layer] = weight
         
-        # Update the mesh to see changes
-        self.bm = bmesh.from_edit_mesh(mesh)
-        bmesh.update_edit_mesh(mesh)
+        # Only a scalar attribute changed, so skip tessellation and topology updates
+        bmesh.update_edit_mesh(self.mesh, loop_triangles=False, destructive=False)
 
     def add_bevel_modifier(self, context):
         """Add a bevel modifier if one matching the current mode doesn't already exist
@@ -189,14 +173,24 @@ class QP_OT_BevelWeight(Operator):
         if event.type == 'MOUSEMOVE':
             # Adjust weight based on mouse movement
             delta = event.mouse_x - self.initial_mouse_x
-            self.weight = max(0.0, min(1.0, self.initial_weight + delta * 0.005))
+            new_weight = max(0.0, min(1.0, self.initial_weight + delta * 0.005))
+            if abs(new_weight - self.weight) < 1e-4:
+                return {'RUNNING_MODAL'}
+            self.weight = new_weight
             
             # Update UI
             type_text = "Vertex" if self.active_mode == 'VERT' else "Edge"
             context.area.header_text_set(f"{type_text} Bevel Weight: {self.weight:.2f} | Segments: {self.segments}")
             
-            # Update the mesh
-            self.update_bevel_weight(context)
+            # Defer the mesh update to the next timer tick
+            self._dirty = True
+            
+            return {'RUNNING_MODAL'}
+        
+        elif event.type == 'TIMER':
+            if self._dirty:
+                self._dirty = False
+                self.update_bevel_weight(context)
             
             return {'RUNNING_MODAL'}
             
@@ -234,9 +228,10 @@ class QP_OT_BevelWeight(Operator):
             return {'RUNNING_MODAL'}
             
         elif event.type == 'LEFTMOUSE':
-            # Accept and finish
-            context.area.header_text_set(None)
-            context.workspace.status_text_set(None)
+            # Accept and finish, applying any pending update first
+            if self._dirty:
+                self.update_bevel_weight(context)
+            self._finish(context)
             return {'FINISHED'}
             
         elif event.type in {'RIGHTMOUSE', 'ESC'}:
@@ -244,14 +239,26 @@ class QP_OT_BevelWeight(Operator):
             self.weight = self.initial_weight
             self.update_bevel_weight(context)
             
-            context.area.header_text_set(None)
-            context.workspace.status_text_set(None)
+            self._finish(context)
             return {'CANCELLED'}
         
         return {'RUNNING_MODAL'}
+    
+    def _finish(self, context):
+        """Remove the update timer and clear the header/status text"""
+        if self._timer:
+            context.window_manager.event_timer_remove(self._timer)
+            self._timer = None
+        self._dirty = False
+        context.area.header_text_set(None)
+        context.workspace.status_text_set(None)
 
     def execute(self, context):
         # This gets called when using redo/undo
+        if self.obj is None:
+            self.obj = context.active_object
+            self.active_mode = 'VERT' if context.tool_settings.mesh_select_mode[0] else 'EDGE'
+        self.cache_selection()
         self.update_bevel_weight(context)
         self.update_segments()
         return {'FINISHED'}
@@ -9,6 +9,8 @@ from bpy.props import StringProperty, BoolProperty, IntProperty, EnumProperty, C
 import sys
 import re
 import os
+from collections import Counter
+from enum import IntEnum
 from .module_helper import ModuleManager
 
 # Module state
@@ -19,11 +21,54 @@ try:
 except (KeyError, AttributeError):
     pass  # Preferences not available yet
 
-# Centralized conflict selections storage
-_conflict_selections = {
-    'materials': {},
-    'node_groups': {},
-    'images': {}
+# Matches Blender's duplicate naming scheme (Material.001)
+_DUPLICATE_SUFFIX_RE = re.compile(r'(.+)\.(\d{3})\Z')
+
+# Node tree interface API (Blender 4.0+); the Blender version is fixed for a session
+_HAS_INTERFACE_API = 'interface' in bpy.types.NodeTree.bl_rna.properties
+
+# Resolved image filepaths, keyed by the raw filepath string
+_image_path_cache = {}
+
+# Identity fingerprints, keyed by as_pointer(). Filled by the analysis and
+# reused when execute groups the same items again; cleared before each
+# analysis and after items are removed, so stale pointers are never read.
+_fingerprint_cache = {}
+
+# ============================================================================
+# DATA TYPES
+# ============================================================================
+
+class DataType(IntEnum):
+    """Index of each supported data type in the per-type tables below"""
+    MATERIALS = 0
+    NODE_GROUPS = 1
+    IMAGES = 2
+
+# Operators and UI carry the data type as a string; convert at those boundaries
+_DTYPE_FROM_STR = {
+    'materials': DataType.MATERIALS,
+    'node_groups': DataType.NODE_GROUPS,
+    'images': DataType.IMAGES
+}
+
+# Centralized conflict selections storage, indexed by DataType
+_conflict_selections = ({}, {}, {})
+
+# Conflicts computed by CLEANUP_OT_analyze_async (keyed by DataType), consumed by the next cleanup invoke
+_pending_analysis = {}
+
+# Number of items analyzed per timer tick in CLEANUP_OT_analyze_async
+ANALYSIS_CHUNK_SIZE = 200
+
+# Most data options listed per conflict in the dialog; execute still processes every item
+MAX_DISPLAY_OPTIONS = 32
+
+# Cleanup operator for each data type
+CLEANUP_OPERATORS = {
+    'materials': 'cleanup.clean_materials',
+    'node_groups': 'cleanup.clean_node_groups',
+    'images': 'cleanup.clean_images'
 }
 
 # ============================================================================
@@ -32,46 +77,75 @@ _conflict_selections = {
 
 class DataTypeConfig:
     """Configuration for different data types"""
+    __slots__ = ('name', 'collection_attr', 'icon', 'linked_icon')
+    
     def __init__(self, name, collection_attr, icon, linked_icon='LINKED'):
         self.name = name
         self.collection_attr = collection_attr
         self.icon = icon
         self.linked_icon = linked_icon
 
-DATA_CONFIGS = {
-    'materials': DataTypeConfig('Material', 'materials', 'MATERIAL'),
-    'node_groups': DataTypeConfig('Node Group', 'node_groups', 'NODETREE'),
-    'images': DataTypeConfig('Image', 'images', 'IMAGE_DATA')
-}
+# Indexed by DataType
+DATA_CONFIGS = (
+    DataTypeConfig('Material', 'materials', 'MATERIAL'),
+    DataTypeConfig('Node Group', 'node_groups', 'NODETREE'),
+    DataTypeConfig('Image', 'images', 'IMAGE_DATA')
+)
 
 # ============================================================================
 # CORE UTILITIES
 # ============================================================================
 
-def is_linked_data(data_block):
+def is_linked_data(data_block) -> bool:
     """Check if data block is linked from another blend file"""
     return hasattr(data_block, 'library') and data_block.library is not None
 
+def _partition_linked(items, linked=None):
+    """Split items into (local, linked) lists in a single pass
+    
+    linked maps as_pointer() -> bool; without it is_linked_data() is called
+    once per item.
+    """
+    local_items = []
+    linked_items = []
+    if linked is None:
+        for item in items:
+            (linked_items if is_linked_data(item) else local_items).append(item)
+    else:
+        for item in items:
+            (linked_items if linked[item.as_pointer()] else local_items).append(item)
+    return local_items, linked_items
+
 def get_linked_file_name(data_block):
     """Get linked file name (basename only)"""
     if is_linked_data(data_block):
         return os.path.basename(data_block.library.name)
     return None
 
-def get_base_name(name):
+def get_base_name(name: str) -> str:
     """Extract base name from duplicated name (Material.001 -> Material)"""
-    match = re.match(r'^(.+?)\.(\d{3})$', name)
-    return match.group(1) if match and 1 <= int(match.group(2)) <= 999 else name
+    # Cheap reject for the common case of names without a ".NNN" suffix
+    if len(name) < 5 or name[-4] != '.':
+        return name
+    match = _DUPLICATE_SUFFIX_RE.match(name)
+    return match.group(1) if match and match.group(2) != '000' else name
 
-def are_materials_identical(mat1, mat2):
+def are_materials_identical(mat1: bpy.types.Material, mat2: bpy.types.Material) -> bool:
     """Check if materials are functionally identical"""
-    if not mat1 or not mat2 or mat1.use_nodes != mat2.use_nodes:
+    if not mat1 or not mat2:
+        return False
+    
+    if mat1 == mat2:
+        return True
+    
+    if mat1.use_nodes != mat2.use_nodes:
         return False
     
     if not mat1.use_nodes:
-        return (mat1.diffuse_color[:3] == mat2.diffuse_color[:3] and
-                mat1.metallic == mat2.metallic and
-                mat1.roughness == mat2.roughness)
+        # Plain float compares first, the color slice allocates tuples
+        return (mat1.metallic == mat2.metallic and
+                mat1.roughness == mat2.roughness and
+                mat1.diffuse_color[:3] == mat2.diffuse_color[:3])
     
     if not mat1.node_tree or not mat2.node_tree:
         return mat1.node_tree == mat2.node_tree
@@ -80,11 +154,10 @@ def are_materials_identical(mat1, mat2):
     if len(nodes1) != len(nodes2):
         return False
     
-    types1 = sorted([n.type for n in nodes1])
-    types2 = sorted([n.type for n in nodes2])
-    return types1 == types2
+    # Compare node type counts - linear, no sorting needed
+    return Counter(n.type for n in nodes1) == Counter(n.type for n in nodes2)
 
-def are_node_groups_identical(ng1, ng2):
+def are_node_groups_identical(ng1: bpy.types.NodeTree, ng2: bpy.types.NodeTree) -> bool:
     """Fixed node group comparison for different Blender versions"""
     if not ng1 or not ng2:
         return False
@@ -97,10 +170,14 @@ def are_node_groups_identical(ng1, ng2):
     if len(ng1.links) != len(ng2.links):
         return False
     
+    # Compare node types before walking the interface
+    if Counter(n.type for n in ng1.nodes) != Counter(n.type for n in ng2.nodes):
+        return False
+    
     # Handle different Blender versions for interface comparison
     try:
         # Try modern Blender 4.0+ interface system first
-        if hasattr(ng1, 'interface') and hasattr(ng2, 'interface'):
+        if _HAS_INTERFACE_API:
             interface1 = ng1.interface
             interface2 = ng2.interface
             
@@ -152,20 +229,28 @@ def are_node_groups_identical(ng1, ng2):
                     return False
         
         else:
-            # If we can't access interface info, just compare nodes
+            # If we can't access interface info, node types already matched
             print(f"Warning: Could not access node group interface for {ng1.name} and {ng2.name}")
     
     except Exception as e:
         print(f"Warning: Node group interface comparison failed: {e}")
-        # Fall back to basic comparison
+        # Fall back to the node type comparison above
     
-    # Compare node types as basic check
-    types1 = sorted([n.type for n in ng1.nodes])
-    types2 = sorted([n.type for n in ng2.nodes])
-    
-    return types1 == types2
+    return True
+
+def resolve_image_path(filepath: str) -> str:
+    """Absolute, normalized form of an image filepath (memoized per analysis)"""
+    resolved = _image_path_cache.get(filepath)
+    if resolved is None:
+        try:
+            path = bpy.path.abspath(filepath) if not os.path.isabs(filepath) else filepath
+            resolved = os.path.normcase(os.path.normpath(path))
+        except (OSError, ValueError):
+            resolved = filepath  # Fallback to string comparison
+        _image_path_cache[filepath] = resolved
+    return resolved
 
-def are_images_identical(img1, img2):
+def are_images_identical(img1: bpy.types.Image, img2: bpy.types.Image) -> bool:
     """Check if images are identical (same file path or properties)"""
     if not img1 or not img2:
         return False
@@ -182,79 +267,234 @@ def are_images_identical(img1, img2):
     
     # Compare file paths
     if img1.filepath and img2.filepath:
-        try:
-            path1 = bpy.path.abspath(img1.filepath) if not os.path.isabs(img1.filepath) else img1.filepath
-            path2 = bpy.path.abspath(img2.filepath) if not os.path.isabs(img2.filepath) else img2.filepath
-            return os.path.normpath(path1) == os.path.normpath(path2)
-        except (OSError, ValueError):
-            return img1.filepath == img2.filepath  # Fallback to string comparison
+        return resolve_image_path(img1.filepath) == resolve_image_path(img2.filepath)
     
     return False
 
-def are_items_identical_by_type(item1, item2, data_collection):
-    """Check if two items are identical based on data collection type"""
+# ============================================================================
+# ENHANCED CONFLICT ANALYSIS WITH IDENTITY GROUPING
+# ============================================================================
+
+def _fingerprint_material(mat: bpy.types.Material) -> tuple:
+    """Hashable key that is equal for materials are_materials_identical() matches"""
+    if not mat.use_nodes:
+        return (False, mat.diffuse_color[:3], mat.metallic, mat.roughness)
+    
+    if not mat.node_tree:
+        return (True, None)
+    
+    return (True, frozenset(Counter(n.type for n in mat.node_tree.nodes).items()))
+
+def _fingerprint_node_group(ng: bpy.types.NodeTree) -> tuple:
+    """Hashable key that is equal for node groups are_node_groups_identical() matches"""
+    inputs = outputs = None
+    
     try:
-        if data_collection == bpy.data.materials:
-            return are_materials_identical(item1, item2)
-        elif data_collection == bpy.data.node_groups:
-            return are_node_groups_identical(item1, item2)
-        elif data_collection == bpy.data.images:
-            return are_images_identical(item1, item2)
-        else:
+        if _HAS_INTERFACE_API:
+            inputs = []
+            outputs = []
+            for item in ng.interface.items_tree:
+                if hasattr(item, 'in_out'):
+                    if item.in_out == 'INPUT':
+                        inputs.append((item.name, item.socket_type))
+                    elif item.in_out == 'OUTPUT':
+                        outputs.append((item.name, item.socket_type))
+            inputs = tuple(sorted(inputs))
+            outputs = tuple(sorted(outputs))
+        elif hasattr(ng, 'inputs'):
+            inputs = tuple((inp.name, inp.type) for inp in ng.inputs)
+            outputs = tuple((out.name, out.type) for out in ng.outputs)
+    except Exception as e:
+        print(f"Warning: Node group interface fingerprint failed: {e}")
+        inputs = outputs = None
+    
+    return (len(ng.links), inputs, outputs, frozenset(Counter(n.type for n in ng.nodes).items()))
+
+def _fingerprint_image(img: bpy.types.Image) -> tuple:
+    """Hashable key that is equal for images are_images_identical() matches"""
+    if not img.filepath:
+        return (False, img.size[:], img.depth, img.channels)
+    
+    return (True, resolve_image_path(img.filepath))
+
+# Quick signatures only read counts and flags. Items with equal fingerprints
+# always have equal signatures, so the signature can be used to skip
+# fingerprinting items that cannot match anything.
+def _signature_material(mat: bpy.types.Material) -> tuple:
+    if mat.use_nodes and mat.node_tree:
+        return (True, len(mat.node_tree.nodes))
+    return (mat.use_nodes, 0)
+
+def _signature_node_group(ng: bpy.types.NodeTree) -> tuple:
+    return (len(ng.nodes), len(ng.links))
+
+def _signature_image(img: bpy.types.Image) -> tuple:
+    # Image.size may load the file, so only the filepath flag is used here
+    return (bool(img.filepath),)
+
+# Comparison, fingerprint and quick signature functions keyed by ID type.
+# Looking up the item's id_type avoids comparing against each bpy.data
+# collection.
+_IDENTITY_DISPATCH = {
+    'MATERIAL': (are_materials_identical, _fingerprint_material, _signature_material),
+    'NODETREE': (are_node_groups_identical, _fingerprint_node_group, _signature_node_group),
+    'IMAGE': (are_images_identical, _fingerprint_image, _signature_image),
+}
+
+def are_items_identical_by_type(item1: bpy.types.ID, item2: bpy.types.ID) -> bool:
+    """Check if two items are identical based on their ID type"""
+    try:
+        handlers = _IDENTITY_DISPATCH.get(item1.id_type)
+        if handlers is None:
             return item1 == item2
+        return handlers[0](item1, item2)
     except Exception as e:
         print(f"Warning: Could not compare items: {e}")
         return False
 
-# ============================================================================
-# ENHANCED CONFLICT ANALYSIS WITH IDENTITY GROUPING
-# ============================================================================
+def get_identity_fingerprint(item: bpy.types.ID) -> tuple:
+    """Get a hashable identity key for an item based on its ID type"""
+    pointer = item.as_pointer()
+    key = _fingerprint_cache.get(pointer)
+    if key is not None:
+        return key
+    
+    key = None
+    handlers = _IDENTITY_DISPATCH.get(item.id_type)
+    if handlers is not None:
+        try:
+            key = handlers[1](item)
+        except Exception as e:
+            print(f"Warning: Could not fingerprint {item.name}: {e}")
+    
+    if key is None:
+        # Unknown types (or failures) only match themselves
+        key = (None, pointer)
+    
+    _fingerprint_cache[pointer] = key
+    return key
+
+def get_quick_signature(item: bpy.types.ID):
+    """Cheap key that equal fingerprints always share (None if unavailable)"""
+    handlers = _IDENTITY_DISPATCH.get(item.id_type)
+    if handlers is not None:
+        try:
+            return handlers[2](item)
+        except Exception:
+            pass
+    return None
 
-def group_items_by_identity(items, data_collection):
-    """Group items by their actual content/structure identity"""
-    identity_groups = []
+class UnionFind:
+    """Disjoint-set forest with union by rank and path compression"""
+    __slots__ = ('parent', 'rank')
+    
+    def __init__(self, size):
+        self.parent = list(range(size))
+        self.rank = [0] * size
+    
+    def find(self, x):
+        parent = self.parent
+        root = x
+        while parent[root] != root:
+            root = parent[root]
+        # Second pass: point every node on the path straight at the root
+        while parent[x] != root:
+            parent[x], x = root, parent[x]
+        return root
+    
+    def union(self, a, b):
+        root_a, root_b = self.find(a), self.find(b)
+        if root_a == root_b:
+            return root_a
+        if self.rank[root_a] < self.rank[root_b]:
+            root_a, root_b = root_b, root_a
+        self.parent[root_b] = root_a
+        if self.rank[root_a] == self.rank[root_b]:
+            self.rank[root_a] += 1
+        return root_a
+
+def group_items_by_identity(items):
+    """Group items by their actual content/structure identity
+    
+    Items are first bucketed by a quick signature. Only items that share a
+    signature with another item are fingerprinted; items sharing a
+    fingerprint are merged into one set.
+    """
+    uf = UnionFind(len(items))
+    
+    candidates = {}
+    for index, item in enumerate(items):
+        candidates.setdefault(get_quick_signature(item), []).append(index)
     
-    for item in items:
-        # Find if this item belongs to an existing group
-        placed_in_group = False
+    for indices in candidates.values():
+        if len(indices) == 1:
+            continue  # Nothing else can match this item
         
-        for group in identity_groups:
-            representative = group['representative']
-            
-            if are_items_identical_by_type(item, representative, data_collection):
-                group['members'].append(item)
-                placed_in_group = True
-                break
-        
-        # If not placed in any existing group, create a new group
-        if not placed_in_group:
-            identity_groups.append({
-                'representative': item,  # First item becomes the representative
-                'members': [item]
-            })
-    
-    return identity_groups
+        first_with_key = {}
+        for index in indices:
+            key = get_identity_fingerprint(items[index])
+            first = first_with_key.setdefault(key, index)
+            if first != index:
+                uf.union(first, index)
+    
+    # Groups keep first-seen order; their first item becomes the representative
+    groups = {}
+    for index, item in enumerate(items):
+        groups.setdefault(uf.find(index), []).append(item)
+    
+    return [{'representative': members[0], 'members': members} for members in groups.values()]
 
-def analyze_data_conflicts_with_grouping(data_collection):
-    """Enhanced conflict analysis that groups identical items together"""
+def iter_data_conflicts_with_grouping(data_collection, chunk_size=ANALYSIS_CHUNK_SIZE):
+    """Incremental conflict analysis
+    
+    Yields (done, total) progress roughly every chunk_size items so callers can
+    spread the work over several timer ticks. The conflicts dict is the
+    generator's return value.
+    """
+    # Relative paths resolve against the current .blend, which may have moved,
+    # and the items may have been edited since the last analysis
+    _image_path_cache.clear()
+    _fingerprint_cache.clear()
+    
+    all_items = list(data_collection)
+    total = len(all_items) * 2  # Base-name pass + identity pass
+    done = 0
+    next_yield = chunk_size
     base_groups = {}
     
     # First, group by base name
-    for item in data_collection:
+    for item in all_items:
         base_name = get_base_name(item.name)
         base_groups.setdefault(base_name, []).append(item)
+        
+        done += 1
+        if done >= next_yield:
+            next_yield += chunk_size
+            yield done, total
     
     conflicts = {}
     
     for base_name, items in base_groups.items():
+        done += len(items)
+        if done >= next_yield:
+            next_yield = done + chunk_size
+            yield done, total
+        
         if len(items) <= 1:
             continue
         
-        # Group items by their actual content/structure
-        identity_groups = group_items_by_identity(items, data_collection)
+        # Group items by their actual content/structure. Pairs are the most
+        # common case, where a single direct comparison is cheapest.
+        if len(items) == 2:
+            if are_items_identical_by_type(items[0], items[1]):
+                identity_groups = [{'representative': items[0], 'members': list(items)}]
+            else:
+                identity_groups = [{'representative': items[0], 'members': [items[0]]},
+                                   {'representative': items[1], 'members': [items[1]]}]
+        else:
+            identity_groups = group_items_by_identity(items)
         
-        local_items = [i for i in items if not is_linked_data(i)]
-        linked_items = [i for i in items if is_linked_data(i)]
+        local_items, linked_items = _partition_linked(items)
         
         # Determine conflict types with improved descriptions
         conflict_types = []
@@ -278,6 +518,15 @@ def analyze_data_conflicts_with_grouping(data_collection):
     
     return conflicts
 
+def analyze_data_conflicts_with_grouping(data_collection):
+    """Enhanced conflict analysis that groups identical items together"""
+    analysis = iter_data_conflicts_with_grouping(data_collection)
+    while True:
+        try:
+            next(analysis)
+        except StopIteration as result:
+            return result.value
+
 # ============================================================================
 # PROPERTY GROUPS
 # ============================================================================
@@ -286,11 +535,11 @@ class CLEANUP_DataOption(PropertyGroup):
     """Unified data option for any data type"""
     data_name: StringProperty(name="Data Name")
     user_count: IntProperty(name="User Count", default=0)
-    is_selected: BoolProperty(name="Selected", default=False)
     is_linked: BoolProperty(name="Is Linked", default=False)
     linked_file: StringProperty(name="Linked File", default="")
     filepath: StringProperty(name="File Path", default="")  # For images
     group_info: StringProperty(name="Group Info", default="")  # For displaying group size
+    has_meaningful_duplicates: BoolProperty(name="Has Meaningful Duplicates", default=False)  # Local item with identical duplicates to remap
 
 class CLEANUP_ConflictItem(PropertyGroup):
     """Unified conflict item for any data type"""
@@ -298,6 +547,8 @@ class CLEANUP_ConflictItem(PropertyGroup):
     conflict_types: StringProperty(name="Conflict Types", default="")
     skip_this_conflict: BoolProperty(name="Skip This Conflict", default=False)
     data_type: StringProperty(name="Data Type", default="")
+    has_meaningful_duplicates: BoolProperty(name="Has Meaningful Duplicates", default=False)  # Any option with duplicates to remap
+    hidden_count: IntProperty(name="Hidden Count", default=0)  # Items beyond MAX_DISPLAY_OPTIONS
     
     data_options: CollectionProperty(type=CLEANUP_DataOption)
 
@@ -305,6 +556,23 @@ class CLEANUP_ConflictItem(PropertyGroup):
 # UNIFIED SELECTION OPERATOR
 # ============================================================================
 
+# Area types that display cleanup UI and need a redraw after a selection change
+CLEANUP_REDRAW_AREAS = {'PROPERTIES', 'VIEW_3D'}
+
+_redraw_pending = False
+
+def _redraw_cleanup_areas():
+    """Timer callback - redraw the areas showing cleanup UI once"""
+    global _redraw_pending
+    _redraw_pending = False
+    
+    for window in bpy.context.window_manager.windows:
+        for area in window.screen.areas:
+            if area.type in CLEANUP_REDRAW_AREAS:
+                area.tag_redraw()
+    
+    return None  # Don't repeat
+
 class CLEANUP_OT_select_data_option(Operator):
     """Unified selection operator for all data types"""
     bl_idname = "cleanup.select_data_option"
@@ -315,55 +583,117 @@ class CLEANUP_OT_select_data_option(Operator):
     data_type: StringProperty()
     
     def execute(self, context):
-        global _conflict_selections
+        dtype = _DTYPE_FROM_STR.get(self.data_type)
+        if dtype is None:
+            return {'CANCELLED'}
         
         # Update global selections
-        _conflict_selections[self.data_type][self.conflict_base_name] = self.data_name
-        
-        # Find and update the cleanup operator's conflict data
-        cleanup_op = self._find_cleanup_operator(context)
+        _conflict_selections[dtype][self.conflict_base_name] = self.data_name
         
-        if cleanup_op:
-            for conflict in cleanup_op.conflicts:
-                if conflict.base_name == self.conflict_base_name:
-                    # Clear all selections in this conflict
-                    for option in conflict.data_options:
-                        option.is_selected = False
-                    
-                    # Set the selected one (only if it's local)
-                    for option in conflict.data_options:
-                        if (option.data_name == self.data_name and not option.is_linked):
-                            option.is_selected = True
-                            break
-                    break
+        # The dialog may have been opened from any editor, refresh the area it belongs to now
+        if context.area:
+            context.area.tag_redraw()
         
-        # Force immediate UI refresh
-        for window in context.window_manager.windows:
-            for area in window.screen.areas:
-                area.tag_redraw()
+        # Schedule a UI refresh; rapid clicks coalesce into a single redraw
+        global _redraw_pending
+        if not _redraw_pending:
+            _redraw_pending = True
+            bpy.app.timers.register(_redraw_cleanup_areas, first_interval=0.016)
         
         return {'FINISHED'}
+
+# ============================================================================
+# ASYNC ANALYSIS OPERATOR
+# ============================================================================
+
+def _conflicts_are_valid(conflicts):
+    """Check that no ID in a stored analysis result has been removed since it was computed"""
+    try:
+        for info in conflicts.values():
+            for item in info['items']:
+                item.as_pointer()
+    except ReferenceError:
+        return False
+    return True
+
+class CLEANUP_OT_analyze_async(Operator):
+    """Analyze duplicates without blocking the UI, then open the cleanup dialog"""
+    bl_idname = "cleanup.analyze_async"
+    bl_label = "Analyze Duplicates"
+    bl_description = "Analyze duplicates and open the cleanup dialog\nShift+Click: Force remap identical items only"
     
-    def _find_cleanup_operator(self, context):
-        """Find the active cleanup operator"""
-        operator_map = {
-            'materials': 'cleanup.clean_materials',
-            'node_groups': 'cleanup.clean_node_groups', 
-            'images': 'cleanup.clean_images'
-        }
+    data_type: StringProperty()
+    
+    _timer = None
+    _analysis = None
+    
+    @classmethod
+    def poll(cls, context):
+        return module_enabled
+    
+    def invoke(self, context, event):
+        dtype = _DTYPE_FROM_STR.get(self.data_type)
+        if dtype is None:
+            self.report({'ERROR'}, f"Unknown data type: {self.data_type}")
+            return {'CANCELLED'}
+        config = DATA_CONFIGS[dtype]
         
-        target_idname = operator_map.get(self.data_type)
-        if not target_idname:
-            return None
-        
-        for op in context.window_manager.operators:
-            if (hasattr(op, 'bl_idname') and 
-                op.bl_idname == target_idname and 
-                hasattr(op, 'conflicts') and
-                hasattr(op, 'has_conflicts') and
-                op.has_conflicts):
-                return op
-        return None
+        # Force remap skips the dialog, so there is nothing to analyze up front
+        if event.shift:
+            return self._call_cleanup_operator('EXEC_DEFAULT')
+        
+        self._analysis = iter_data_conflicts_with_grouping(getattr(bpy.data, config.collection_attr))
+        self._timer = context.window_manager.event_timer_add(0.01, window=context.window)
+        context.window_manager.modal_handler_add(self)
+        return {'RUNNING_MODAL'}
+    
+    def modal(self, context, event):
+        if event.type == 'ESC':
+            self._cleanup(context)
+            self.report({'INFO'}, "Analysis cancelled")
+            return {'CANCELLED'}
+        
+        if event.type != 'TIMER':
+            return {'PASS_THROUGH'}
+        
+        try:
+            done, total = next(self._analysis)
+        except StopIteration as result:
+            self._cleanup(context)
+            dtype = _DTYPE_FROM_STR[self.data_type]
+            _pending_analysis[dtype] = result.value
+            try:
+                return self._call_cleanup_operator('INVOKE_DEFAULT')
+            except Exception as e:
+                self.report({'ERROR'}, f"Could not open cleanup dialog: {e}")
+                return {'CANCELLED'}
+            finally:
+                # Only the invoke started above may use this result
+                _pending_analysis.pop(dtype, None)
+        except Exception as e:
+            # Data can be removed (or undone) between ticks, leaving stale references
+            self._cleanup(context)
+            self.report({'ERROR'}, f"Analysis stopped: {e}")
+            return {'CANCELLED'}
+        
+        context.workspace.status_text_set(
+            f"Analyzing {self.data_type.replace('_', ' ')}... {done * 100 // max(total, 1)}% (ESC: Cancel)")
+        return {'RUNNING_MODAL'}
+    
+    def _call_cleanup_operator(self, execution_context):
+        module_name, op_name = CLEANUP_OPERATORS[self.data_type].split('.')
+        getattr(getattr(bpy.ops, module_name), op_name)(execution_context)
+        return {'FINISHED'}
+    
+    def _cleanup(self, context):
+        if self._timer:
+            context.window_manager.event_timer_remove(self._timer)
+            self._timer = None
+        self._analysis = None
+        context.workspace.status_text_set(None)
+    
+    def cancel(self, context):
+        self._cleanup(context)
 
 # ============================================================================
 # BASE CLEANUP OPERATOR CLASS
@@ -387,13 +717,20 @@ class BaseCleanupOperator(Operator):
         default='AUTO_CLEAN'  # New default
     )
     
+    # Conflict analysis from invoke, reused by execute until data is removed
+    _cached_conflicts = None
+    
+    # Per-conflict option index lists for drawing, keyed by base name
+    _option_indices = None
+    
     # Abstract properties that subclasses must define
-    DATA_TYPE = None
+    DATA_TYPE = None  # String form, used for RNA properties and operator lookup
+    DATA_INDEX = None  # DataType, used to index the per-type tables
     
     @property
     def config(self):
         """Get configuration for this data type"""
-        return DATA_CONFIGS[self.DATA_TYPE]
+        return DATA_CONFIGS[self.DATA_INDEX]
     
     @property
     def data_collection(self):
@@ -404,24 +741,28 @@ class BaseCleanupOperator(Operator):
     def poll(cls, context):
         if not module_enabled:
             return False
-        if cls.DATA_TYPE is None:
+        if cls.DATA_INDEX is None:
             return False
-        return bool(getattr(bpy.data, DATA_CONFIGS[cls.DATA_TYPE].collection_attr, None))
+        return bool(getattr(bpy.data, DATA_CONFIGS[cls.DATA_INDEX].collection_attr, None))
     
     def invoke(self, context, event):
-        global _conflict_selections
-        _conflict_selections[self.DATA_TYPE].clear()
+        _conflict_selections[self.DATA_INDEX].clear()
         
         self.force_remap = event.shift
         if self.force_remap:
             return self.execute(context)
         
-        # Use enhanced conflict analysis with grouping
-        conflicts = analyze_data_conflicts_with_grouping(self.data_collection)
+        # Use the result of a preceding async analysis if there is one and its data still exists
+        conflicts = _pending_analysis.pop(self.DATA_INDEX, None)
+        if conflicts is None or not _conflicts_are_valid(conflicts):
+            conflicts = analyze_data_conflicts_with_grouping(self.data_collection)
+        self._cached_conflicts = conflicts
         
         if conflicts:
             self.has_conflicts = True
             self.conflicts.clear()
+            self._option_indices = {}
+            resolution = self.global_resolution
             
             # Always collect ALL conflicts, then filter during display
             for base_name, info in conflicts.items():
@@ -431,74 +772,88 @@ class BaseCleanupOperator(Operator):
                 conflict_item.data_type = self.DATA_TYPE
                 
                 # Store all items for later filtering in draw methods
-                local_items = [item for item in info['items'] if not is_linked_data(item)]
-                linked_items = [item for item in info['items'] if is_linked_data(item)]
+                local_items = info['local_items']
+                linked_ptrs = {item.as_pointer() for item in info['linked_items']}
                 
                 # Initialize selection for Choose Data mode
-                if self.global_resolution == 'CHOOSE_DATA' and local_items:
+                if resolution == 'CHOOSE_DATA' and local_items:
                     selected_option_name = local_items[0].name
-                    _conflict_selections[self.DATA_TYPE][base_name] = selected_option_name
+                    _conflict_selections[self.DATA_INDEX][base_name] = selected_option_name
+                
+                # Add items (both local and linked) to data_options, capped
+                # so huge conflicts don't cost a long list on every redraw
+                shown_items = self._get_shown_items(info)
+                conflict_item.hidden_count = len(info['items']) - len(shown_items)
                 
-                # Add ALL items (both local and linked) to data_options
-                for item in info['items']:
+                options_by_ptr = {}
+                for item in shown_items:
                     option = conflict_item.data_options.add()
+                    options_by_ptr[item.as_pointer()] = option
                     option.data_name = item.name
                     option.user_count = item.users
-                    option.is_linked = is_linked_data(item)
+                    option.is_linked = item.as_pointer() in linked_ptrs
                     
                     if option.is_linked:
                         option.linked_file = get_linked_file_name(item) or "Unknown"
                     
-                    if self.DATA_TYPE == 'images' and hasattr(item, 'filepath'):
+                    if self.DATA_INDEX == DataType.IMAGES and hasattr(item, 'filepath'):
                         option.filepath = item.filepath
-                    
-                    # Set selection for Choose Data mode
-                    if (self.global_resolution == 'CHOOSE_DATA' and 
-                        not option.is_linked and 
-                        local_items and 
-                        item.name == local_items[0].name):
-                        option.is_selected = True
-                    else:
-                        option.is_selected = False
                 
                 # Store identity groups info for Auto Clean mode
-                if self.global_resolution == 'AUTO_CLEAN':
+                if resolution == 'AUTO_CLEAN':
                     # Only calculate group info for items that actually have duplicates to clean
                     for group in info['identity_groups']:
                         representative = group['representative']
-                        local_members = [m for m in group['members'] if not is_linked_data(m)]
+                        local_members = [m for m in group['members'] if m.as_pointer() not in linked_ptrs]
                         
                         # Only process groups with multiple local members (actual duplicates)
                         if len(local_members) > 1:
                             group_size = len(group['members'])
                             
                             # Update the representative option with group info
-                            for option in conflict_item.data_options:
-                                if (option.data_name == representative.name and 
-                                    option.is_linked == is_linked_data(representative)):
-                                    if group_size > 1:
-                                        option.group_info = f"(+{group_size-1} identical will be remapped)"
-                                    else:
-                                        option.group_info = "(unique)"
-                                    option.user_count = sum(member.users for member in group['members'])
-                                    break
+                            option = options_by_ptr.get(representative.as_pointer())
+                            if option is not None:
+                                if group_size > 1:
+                                    option.group_info = f"(+{group_size-1} identical will be remapped)"
+                                    option.has_meaningful_duplicates = not option.is_linked
+                                    if option.has_meaningful_duplicates:
+                                        conflict_item.has_meaningful_duplicates = True
+                                else:
+                                    option.group_info = "(unique)"
+                                option.user_count = sum(member.users for member in group['members'])
             
             # Always show dialog if there are any conflicts
             if self.conflicts:
-                dialog_width = 800 if self.global_resolution == 'AUTO_CLEAN' else 700
+                dialog_width = 800 if resolution == 'AUTO_CLEAN' else 700
                 return context.window_manager.invoke_props_dialog(self, width=dialog_width)
         
         return self.execute(context)
     
+    def _get_shown_items(self, info):
+        """Items of a conflict to list in the dialog
+        
+        The first MAX_DISPLAY_OPTIONS items, plus every local item and the
+        identity group representatives beyond the cap. Local items are the
+        ones Choose Data remaps, so each of them must stay selectable.
+        """
+        items = info['items']
+        if len(items) <= MAX_DISPLAY_OPTIONS:
+            return items
+        
+        required_ptrs = {item.as_pointer() for item in info['local_items']}
+        required_ptrs.update(group['representative'].as_pointer()
+                             for group in info['identity_groups'] if len(group['members']) > 1)
+        return [item for index, item in enumerate(items)
+                if index < MAX_DISPLAY_OPTIONS or item.as_pointer() in required_ptrs]
+    
     def _get_local_identity_groups(self, identity_groups):
         """Get identity groups that contain local (non-linked) items"""
         local_groups = []
         for group in identity_groups:
-            local_members = [member for member in group['members'] if not is_linked_data(member)]
+            local_members = _partition_linked(group['members'])[0]
             if local_members:
-                local_representative = next((member for member in group['members'] if not is_linked_data(member)), group['representative'])
                 local_groups.append({
-                    'representative': local_representative,
+                    'representative': local_members[0],
                     'members': group['members']
                 })
         return local_groups
@@ -519,22 +874,18 @@ class BaseCleanupOperator(Operator):
             
             layout.separator()
             
-            # Show conflicts based on global strategy
+            # Show conflicts based on global strategy (read once per redraw)
+            resolution = self.global_resolution
             for conflict in self.conflicts:
-                self._draw_conflict(layout, conflict)
+                self._draw_conflict(layout, conflict, resolution)
         else:
             layout.label(text="No conflicts found. Processing...")
     
-    def _draw_conflict(self, layout, conflict):
+    def _draw_conflict(self, layout, conflict, resolution):
         """Draw individual conflict UI"""
-        # For Auto Clean, check if this conflict has meaningful duplicates before drawing
-        if self.global_resolution == 'AUTO_CLEAN':
-            meaningful_options = [opt for opt in conflict.data_options 
-                                if not opt.is_linked and opt.group_info and 
-                                "(+" in opt.group_info and "identical will be remapped)" in opt.group_info]
-            
-            if not meaningful_options:
-                return  # Don't draw conflicts with no meaningful duplicates
+        # For Auto Clean, skip conflicts without meaningful duplicates (flag set in invoke)
+        if resolution == 'AUTO_CLEAN' and not conflict.has_meaningful_duplicates:
+            return
         
         box = layout.box()
         
@@ -544,17 +895,17 @@ class BaseCleanupOperator(Operator):
         header_row.label(text=f"({conflict.conflict_types})")
         
         # Individual skip option (not for AUTO_CLEAN)
-        if self.global_resolution != 'AUTO_CLEAN':
+        if resolution != 'AUTO_CLEAN':
             skip_row = box.row()
             skip_row.prop(conflict, "skip_this_conflict", text="Skip this conflict")
         
         if not conflict.skip_this_conflict:
-            if self.global_resolution == 'AUTO_CLEAN':
-                self._draw_auto_clean_summary(box, conflict)
-            elif self.global_resolution == 'CHOOSE_DATA':
-                self._draw_choose_data_options(box, conflict)
-            elif self.global_resolution == 'KEEP_LINKED':
-                self._draw_preview_options(box, conflict)
+            drawer = self._RESOLUTION_DRAWERS.get(resolution)
+            if drawer is not None:
+                drawer(self, box, conflict)
+            
+            if conflict.hidden_count and resolution != 'AUTO_CLEAN':
+                box.label(text=f"{conflict.hidden_count} more not shown (still processed)", icon='THREE_DOTS')
         elif conflict.skip_this_conflict:
             skip_box = box.box()
             skip_box.label(text="This conflict will be skipped", icon='PAUSE')
@@ -562,14 +913,7 @@ class BaseCleanupOperator(Operator):
     def _draw_auto_clean_summary(self, box, conflict):
         """Draw Auto Clean summary showing what will be done"""
         # Filter to only show items that actually have duplicates to clean
-        meaningful_options = [opt for opt in conflict.data_options 
-                            if not opt.is_linked and opt.group_info and 
-                            "(+1 identical will be remapped)" in opt.group_info or 
-                            "(+2 identical will be remapped)" in opt.group_info or
-                            "(+3 identical will be remapped)" in opt.group_info or
-                            "(+4 identical will be remapped)" in opt.group_info or
-                            "(+5 identical will be remapped)" in opt.group_info or
-                            "(+" in opt.group_info and "identical will be remapped)" in opt.group_info]
+        meaningful_options = self._get_options(conflict, 'meaningful')
         
         if not meaningful_options:
             # This conflict has no actual duplicates to clean - don't show it
@@ -596,7 +940,7 @@ class BaseCleanupOperator(Operator):
         options_box = box.box()
         
         # Filter to only show local data
-        local_options = [opt for opt in conflict.data_options if not opt.is_linked]
+        local_options = self._get_options(conflict, 'local')
         
         if len(local_options) < 2:
             # Compact display for no choice needed
@@ -604,7 +948,7 @@ class BaseCleanupOperator(Operator):
             row.label(text=f"No choice needed for {self.config.name.lower()}:", icon='INFO')
             
             # Show linked versions in a compact format
-            linked_options = [opt for opt in conflict.data_options if opt.is_linked]
+            linked_options = self._get_options(conflict, 'linked')
             if linked_options:
                 linked_row = options_box.row()
                 linked_names = ", ".join([opt.data_name for opt in linked_options])
@@ -617,18 +961,14 @@ class BaseCleanupOperator(Operator):
             options_box.label(text=selection_text)
             
             # Get current selection from global state
-            global _conflict_selections
-            current_selection = _conflict_selections[self.DATA_TYPE].get(conflict.base_name)
-            
-            # Sync selection state
-            for option in local_options:
-                option.is_selected = (option.data_name == current_selection)
+            current_selection = _conflict_selections[self.DATA_INDEX].get(conflict.base_name)
             
             for option in local_options:
                 row = options_box.row()
                 row.scale_y = 1.2
                 
-                is_selected = option.is_selected
+                # The selection dict is authoritative, no need to write it back per redraw
+                is_selected = (option.data_name == current_selection)
                 
                 # Button text (no group info in choose mode)
                 button_text = f"{'●' if is_selected else '○'} {option.data_name}"
@@ -645,7 +985,7 @@ class BaseCleanupOperator(Operator):
                 
                 # Details showing individual users
                 details = f"Users: {option.user_count} | Local"
-                if self.DATA_TYPE == 'images' and option.filepath:
+                if self.DATA_INDEX == DataType.IMAGES and option.filepath:
                     details += f" | {os.path.basename(option.filepath)}"
                 
                 details_col = row.column()
@@ -656,8 +996,8 @@ class BaseCleanupOperator(Operator):
     def _draw_preview_options(self, box, conflict):
         """Draw preview for KEEP_LINKED mode with proper icons"""
         # Separate linked and local options
-        linked_options = [opt for opt in conflict.data_options if opt.is_linked]
-        local_options = [opt for opt in conflict.data_options if not opt.is_linked]
+        linked_options = self._get_options(conflict, 'linked')
+        local_options = self._get_options(conflict, 'local')
         
         # Show what will be kept (linked data)
         if linked_options:
@@ -693,80 +1033,71 @@ class BaseCleanupOperator(Operator):
                 details_col.alignment = 'RIGHT'
                 details_col.label(text=f"Users: {option.user_count}")
     
+    def _get_options(self, conflict, kind):
+        """Data options of a conflict by kind: 'local', 'linked' or 'meaningful'
+        
+        The options don't change while the dialog is open, so each conflict's
+        options are partitioned into index lists once instead of being
+        filtered several times on every redraw.
+        """
+        if self._option_indices is None:
+            self._option_indices = {}
+        
+        indices = self._option_indices.get(conflict.base_name)
+        if indices is None:
+            indices = {'local': [], 'linked': [], 'meaningful': []}
+            for index, option in enumerate(conflict.data_options):
+                indices['linked' if option.is_linked else 'local'].append(index)
+                if option.has_meaningful_duplicates:
+                    indices['meaningful'].append(index)
+            self._option_indices[conflict.base_name] = indices
+        
+        options = conflict.data_options
+        return [options[index] for index in indices[kind]]
+    
     def execute(self, context):
         """Execute cleanup with enhanced strategies"""
-        if not self.has_conflicts:
-            return self._standard_cleanup_with_grouping()
-        
-        if self.global_resolution == 'AUTO_CLEAN':
-            return self._auto_clean_execution()
-        elif self.global_resolution == 'CHOOSE_DATA':
-            return self._choose_data_execution()
-        elif self.global_resolution == 'KEEP_LINKED':
-            return self._keep_linked_execution()
-        else:
-            return self._conflict_cleanup_with_grouping()
+        try:
+            if not self.has_conflicts:
+                return self._standard_cleanup_with_grouping()
+            
+            executor = self._RESOLUTION_EXECUTORS.get(self.global_resolution,
+                                                      BaseCleanupOperator._conflict_cleanup_with_grouping)
+            return executor(self)
+        finally:
+            # Items have been removed, the analysis no longer matches the data
+            self._cached_conflicts = None
+            _fingerprint_cache.clear()
     
     def _auto_clean_execution(self):
         """Auto Clean execution - automatically clean identical groups"""
-        processed = 0
         skipped = 0
+        remaps = []
         
-        # Use the standard cleanup logic but only process meaningful duplicates
-        conflicts = analyze_data_conflicts_with_grouping(self.data_collection)
+        # The identity groups from the analysis are all that is needed here
+        conflicts = self._get_conflicts()
         
         for conflict_base_name, info in conflicts.items():
-            # Check if this conflict has meaningful duplicates to clean
-            has_meaningful_duplicates = False
+            local_ptrs = {item.as_pointer() for item in info['local_items']}
+            
+            # Only groups with several local members have duplicates to clean
+            duplicate_groups = []
             for group in info['identity_groups']:
-                local_members = [m for m in group['members'] if not is_linked_data(m)]
-                if len(local_members) > 1:  # This group has local duplicates
-                    has_meaningful_duplicates = True
-                    break
+                local_members = [m for m in group['members'] if m.as_pointer() in local_ptrs]
+                if len(local_members) > 1:
+                    duplicate_groups.append(local_members)
             
-            if not has_meaningful_duplicates:
+            if not duplicate_groups:
                 # Count items that would be skipped for reporting
-                all_items = [i for i in self.data_collection if get_base_name(i.name) == conflict_base_name]
-                skipped += len(all_items) - 1
+                skipped += len(info['items']) - 1
                 continue
             
-            # Process the meaningful duplicates using standard grouping logic
-            base_groups = {}
-            for item in self.data_collection:
-                base_name = get_base_name(item.name)
-                if base_name == conflict_base_name:
-                    base_groups.setdefault(base_name, []).append(item)
-            
-            for base_name, items in base_groups.items():
-                if len(items) <= 1:
-                    continue
-                
-                # Group by identity
-                identity_groups = group_items_by_identity(items, self.data_collection)
-                
-                # Process each identity group
-                for group in identity_groups:
-                    members = group['members']
-                    if len(members) <= 1:
-                        continue
-                    
-                    # Choose representative (prefer local, then alphabetically first)
-                    local_members = [m for m in members if not is_linked_data(m)]
-                    representative = local_members[0] if local_members else members[0]
-                    
-                    # Remap all other members to the representative
-                    for member in members:
-                        if member == representative:
-                            continue
-                        
-                        # Safety check: never remove linked data
-                        if is_linked_data(member):
-                            continue
-                        
-                        # Safe to remap since we're only processing identical items
-                        self._remap_data(member, representative)
-                        self.data_collection.remove(member)
-                        processed += 1
+            for local_members in duplicate_groups:
+                # Keep the first local member, linked data is never removed
+                representative = local_members[0]
+                remaps.extend((member, representative) for member in local_members[1:])
+        
+        processed = self._remap_and_remove(remaps)
         
         message = f"Processed {processed} {self.config.collection_attr}"
         if skipped:
@@ -777,28 +1108,28 @@ class BaseCleanupOperator(Operator):
     
     def _choose_data_execution(self):
         """Choose Data execution - remap everything to chosen item regardless of identity"""
-        global _conflict_selections
-        processed = 0
         skipped = 0
         no_choice_needed = 0
+        remaps = []
+        base_index, linked = self._build_item_index()
         
         for conflict in self.conflicts:
             if conflict.skip_this_conflict:
                 base_name = conflict.base_name
-                all_items = [i for i in self.data_collection if get_base_name(i.name) == base_name]
+                all_items = base_index.get(base_name, [])
                 skipped += len(all_items) - 1
                 continue
             
             base_name = conflict.base_name
-            all_items = [i for i in self.data_collection if get_base_name(i.name) == base_name]
-            local_items = [i for i in all_items if not is_linked_data(i)]
+            all_items = base_index.get(base_name, [])
+            local_items = [i for i in all_items if not linked[i.as_pointer()]]
             
             # Check if there's actually a choice to make
             if len(local_items) < 2:
                 no_choice_needed += len(all_items) - 1 if all_items else 0
                 continue
             
-            selected_name = _conflict_selections[self.DATA_TYPE].get(base_name)
+            selected_name = _conflict_selections[self.DATA_INDEX].get(base_name)
             
             if not selected_name:
                 continue
@@ -814,13 +1145,14 @@ class BaseCleanupOperator(Operator):
                 continue
             
             # Remap ALL other items to the selected target (regardless of identity)
+            target_ptr = target.as_pointer()
             for item in all_items:
-                if item != target and not is_linked_data(item):
-                    self._remap_data(item, target)
-                    self.data_collection.remove(item)
-                    processed += 1
+                item_ptr = item.as_pointer()
+                if item_ptr != target_ptr and not linked[item_ptr]:
+                    remaps.append((item, target))
         
-        _conflict_selections[self.DATA_TYPE].clear()
+        processed = self._remap_and_remove(remaps)
+        _conflict_selections[self.DATA_INDEX].clear()
         
         message = f"Processed {processed} {self.config.collection_attr}"
         if skipped:
@@ -833,17 +1165,18 @@ class BaseCleanupOperator(Operator):
     
     def _keep_linked_execution(self):
         """Keep Linked execution - remap local data to linked versions"""
-        processed = 0
         skipped = 0
         no_linked_available = 0
+        remaps = []
         
-        # Re-analyze conflicts to get fresh data
-        conflicts = analyze_data_conflicts_with_grouping(self.data_collection)
+        # Reuse the analysis from invoke (data is unchanged since then)
+        conflicts = self._get_conflicts()
+        base_index, linked = self._build_item_index()
         
         for conflict in self.conflicts:
             if conflict.skip_this_conflict:
                 base_name = conflict.base_name
-                all_items = [i for i in self.data_collection if get_base_name(i.name) == base_name]
+                all_items = base_index.get(base_name, [])
                 skipped += len(all_items) - 1
                 continue
             
@@ -855,8 +1188,7 @@ class BaseCleanupOperator(Operator):
             
             # Find linked and local items
             all_items = conflict_info['items']
-            linked_items = [item for item in all_items if is_linked_data(item)]
-            local_items = [item for item in all_items if not is_linked_data(item)]
+            local_items, linked_items = _partition_linked(all_items, linked)
             
             if not linked_items:
                 no_linked_available += len(local_items)
@@ -866,14 +1198,10 @@ class BaseCleanupOperator(Operator):
             target_linked = linked_items[0]
             
             # Remap all local items to the linked target
-            for local_item in local_items:
-                try:
-                    self._remap_data(local_item, target_linked)
-                    self.data_collection.remove(local_item)
-                    processed += 1
-                except Exception as e:
-                    print(f"Warning: Could not remap {local_item.name} to {target_linked.name}: {e}")
-                    skipped += 1
+            remaps.extend((local_item, target_linked) for local_item in local_items)
+        
+        processed = self._remap_and_remove(remaps)
+        skipped += len(remaps) - processed
         
         message = f"Processed {processed} {self.config.collection_attr}"
         if skipped:
@@ -886,20 +1214,17 @@ class BaseCleanupOperator(Operator):
     
     def _standard_cleanup_with_grouping(self):
         """Enhanced standard cleanup that respects identity groups"""
-        base_groups = {}
-        for item in self.data_collection:
-            base_name = get_base_name(item.name)
-            base_groups.setdefault(base_name, []).append(item)
+        base_groups, linked = self._build_item_index()
         
-        processed = 0
         skipped_linked = 0
+        remaps = []
         
         for base_name, items in base_groups.items():
             if len(items) <= 1:
                 continue
             
             # Group by identity
-            identity_groups = group_items_by_identity(items, self.data_collection)
+            identity_groups = group_items_by_identity(items)
             
             # Process each identity group
             for group in identity_groups:
@@ -908,23 +1233,18 @@ class BaseCleanupOperator(Operator):
                     continue
                 
                 # Choose representative (prefer local, then alphabetically first)
-                local_members = [m for m in members if not is_linked_data(m)]
-                representative = local_members[0] if local_members else members[0]
-                
-                # Remap all other members to the representative
-                for member in members:
-                    if member == representative:
-                        continue
-                    
+                local_members, linked_members = _partition_linked(members, linked)
+                if not local_members:
                     # Safety check: never remove linked data
-                    if is_linked_data(member):
-                        skipped_linked += 1
-                        continue
-                    
-                    # Safe to remap since we're only processing identical items
-                    self._remap_data(member, representative)
-                    self.data_collection.remove(member)
-                    processed += 1
+                    skipped_linked += len(linked_members) - 1
+                    continue
+                
+                # Remap all other local members to the representative
+                representative = local_members[0]
+                skipped_linked += len(linked_members)
+                remaps.extend((member, representative) for member in local_members[1:])
+        
+        processed = self._remap_and_remove(remaps)
         
         message = f"Processed {processed} {self.config.collection_attr}"
         if skipped_linked > 0:
@@ -935,17 +1255,17 @@ class BaseCleanupOperator(Operator):
     
     def _conflict_cleanup_with_grouping(self):
         """Enhanced conflict cleanup with identity group awareness"""
-        global _conflict_selections
-        processed = 0
         skipped = 0
+        remaps = []
         
-        # Re-analyze conflicts to get fresh identity groups
-        conflicts = analyze_data_conflicts_with_grouping(self.data_collection)
+        # Reuse the identity groups from invoke (data is unchanged since then)
+        conflicts = self._get_conflicts()
+        base_index, linked = self._build_item_index()
         
         for conflict in self.conflicts:
             if conflict.skip_this_conflict:
                 base_name = conflict.base_name
-                all_items = [i for i in self.data_collection if get_base_name(i.name) == base_name]
+                all_items = base_index.get(base_name, [])
                 skipped += len(all_items) - 1
                 continue
             
@@ -956,7 +1276,7 @@ class BaseCleanupOperator(Operator):
                 continue
             
             identity_groups = conflict_info['identity_groups']
-            selected_name = _conflict_selections[self.DATA_TYPE].get(base_name)
+            selected_name = _conflict_selections[self.DATA_INDEX].get(base_name)
             
             if not selected_name:
                 continue
@@ -971,28 +1291,20 @@ class BaseCleanupOperator(Operator):
             if not target_group:
                 continue
             
-            target_representative = target_group['representative']
-            
-            # Process each identity group
+            # Process each identity group. The selected group's representative
+            # is the selected item, so every group keeps its representative and
+            # remaps its identical duplicates to it.
             for group in identity_groups:
                 representative = group['representative']
+                representative_ptr = representative.as_pointer()
                 
-                if group == target_group:
-                    # Selected group - remap all members to selected representative
-                    for member in group['members']:
-                        if member != target_representative and not is_linked_data(member):
-                            self._remap_data(member, target_representative)
-                            self.data_collection.remove(member)
-                            processed += 1
-                else:
-                    # Non-selected group - keep representative, remap identical duplicates
-                    for member in group['members']:
-                        if member != representative and not is_linked_data(member):
-                            self._remap_data(member, representative)
-                            self.data_collection.remove(member)
-                            processed += 1
-        
-        _conflict_selections[self.DATA_TYPE].clear()
+                for member in group['members']:
+                    member_ptr = member.as_pointer()
+                    if member_ptr != representative_ptr and not linked[member_ptr]:
+                        remaps.append((member, representative))
+        
+        processed = self._remap_and_remove(remaps)
+        _conflict_selections[self.DATA_INDEX].clear()
         
         message = f"Processed {processed} {self.config.collection_attr}"
         if skipped:
@@ -1001,9 +1313,83 @@ class BaseCleanupOperator(Operator):
         self.report({'INFO'}, message)
         return {'FINISHED'}
     
+    def _get_conflicts(self):
+        """Conflict analysis for the current data, computed at most once per run"""
+        if self._cached_conflicts is None:
+            self._cached_conflicts = analyze_data_conflicts_with_grouping(self.data_collection)
+        return self._cached_conflicts
+    
+    def _build_item_index(self):
+        """Index the conflicting items once per execution
+        
+        Returns (base_index, linked): base_index maps base name -> items,
+        linked maps item pointer -> is_linked_data(item). Both come from the
+        conflict analysis, which already computed each item's base name and
+        linked state; names without duplicates have nothing to clean.
+        """
+        base_index = {}
+        linked = {}
+        for base_name, info in self._get_conflicts().items():
+            base_index[base_name] = info['items']
+            for item in info['local_items']:
+                linked[item.as_pointer()] = False
+            for item in info['linked_items']:
+                linked[item.as_pointer()] = True
+        return base_index, linked
+    
+    def _remap_and_remove(self, remaps):
+        """Remap each (old, new) pair and remove the old items
+        
+        Items are collected first and removed here, after all loops over the
+        data are done, with a single bpy.data.batch_remove call.
+        Returns the number of items removed.
+        """
+        to_remove = []
+        for old_data, new_data in remaps:
+            try:
+                self._remap_data(old_data, new_data)
+                to_remove.append(old_data)
+            except Exception as e:
+                print(f"Warning: Could not remap {old_data.name} to {new_data.name}: {e}")
+        
+        if not to_remove:
+            return 0
+        
+        try:
+            bpy.data.batch_remove(ids=to_remove)
+            return len(to_remove)
+        except Exception as e:
+            print(f"Warning: Batch removal failed, removing one by one: {e}")
+        
+        processed = 0
+        for old_data in to_remove:
+            try:
+                self.data_collection.remove(old_data)
+                processed += 1
+            except (ReferenceError, RuntimeError) as e:
+                print(f"Warning: Could not remove data: {e}")
+        return processed
+    
     def _remap_data(self, old_data, new_data):
-        """Remap data usage throughout scene - implemented by subclasses"""
-        raise NotImplementedError("Subclasses must implement _remap_data method")
+        """Remap every user of old_data to new_data
+        
+        ID.user_remap walks Blender's ID references in C, covering object
+        slots, node trees and modifiers alike. Subclasses only override this
+        for data types that need special handling.
+        """
+        old_data.user_remap(new_data)
+    
+    # Resolution strategy dispatch, built once with the class
+    _RESOLUTION_DRAWERS = {
+        'AUTO_CLEAN': _draw_auto_clean_summary,
+        'CHOOSE_DATA': _draw_choose_data_options,
+        'KEEP_LINKED': _draw_preview_options,
+    }
+    _RESOLUTION_EXECUTORS = {
+        'AUTO_CLEAN': _auto_clean_execution,
+        'CHOOSE_DATA': _choose_data_execution,
+        'KEEP_LINKED': _keep_linked_execution,
+    }
 
 # ============================================================================
 # CONCRETE CLEANUP OPERATORS
@@ -1017,21 +1403,7 @@ class CLEANUP_OT_clean_materials(BaseCleanupOperator):
     bl_options = {'REGISTER', 'UNDO'}
     
     DATA_TYPE = 'materials'
-    
-    def _remap_data(self, old_mat, new_mat):
-        """Remap material usage throughout scene"""
-        # Object slots
-        for obj in bpy.data.objects:
-            if hasattr(obj, 'material_slots'):
-                for slot in obj.material_slots:
-                    if slot.material == old_mat:
-                        slot.material = new_mat
-        
-        # Node groups  
-        for ng in bpy.data.node_groups:
-            for node in ng.nodes:
-                if hasattr(node, 'material') and node.material == old_mat:
-                    node.material = new_mat
+    DATA_INDEX = DataType.MATERIALS
 
 class CLEANUP_OT_clean_node_groups(BaseCleanupOperator):
     """Clean duplicate node groups with content-aware optimization"""
@@ -1041,38 +1413,7 @@ class CLEANUP_OT_clean_node_groups(BaseCleanupOperator):
     bl_options = {'REGISTER', 'UNDO'}
     
     DATA_TYPE = 'node_groups'
-    
-    def _remap_data(self, old_ng, new_ng):
-        """Safely remap node group usage throughout scene"""
-        # Remap in other node groups
-        for ng in bpy.data.node_groups:
-            if ng == old_ng:
-                continue
-            for node in ng.nodes:
-                if node.type == 'GROUP' and hasattr(node, 'node_tree') and node.node_tree == old_ng:
-                    node.node_tree = new_ng
-        
-        # Remap in geometry node modifiers
-        for obj in bpy.data.objects:
-            for mod in obj.modifiers:
-                if (mod.type == 'NODES' and 
-                    hasattr(mod, 'node_group') and 
-                    mod.node_group == old_ng):
-                    mod.node_group = new_ng
-        
-        # Remap in material node trees
-        for mat in bpy.data.materials:
-            if mat.node_tree:
-                for node in mat.node_tree.nodes:
-                    if node.type == 'GROUP' and hasattr(node, 'node_tree') and node.node_tree == old_ng:
-                        node.node_tree = new_ng
-        
-        # Remap in world node trees
-        for world in bpy.data.worlds:
-            if world.node_tree:
-                for node in world.node_tree.nodes:
-                    if node.type == 'GROUP' and hasattr(node, 'node_tree') and node.node_tree == old_ng:
-                        node.node_tree = new_ng
+    DATA_INDEX = DataType.NODE_GROUPS
 
 class CLEANUP_OT_clean_images(BaseCleanupOperator):
     """Clean duplicate images with content-aware optimization"""
@@ -1082,34 +1423,7 @@ class CLEANUP_OT_clean_images(BaseCleanupOperator):
     bl_options = {'REGISTER', 'UNDO'}
     
     DATA_TYPE = 'images'
-    
-    def _remap_data(self, old_img, new_img):
-        """Safely remap image usage throughout scene"""
-        # Remap in materials
-        for mat in bpy.data.materials:
-            if mat.node_tree:
-                for node in mat.node_tree.nodes:
-                    if (node.type == 'TEX_IMAGE' and 
-                        hasattr(node, 'image') and 
-                        node.image == old_img):
-                        node.image = new_img
-        
-        # Remap in node groups
-        for ng in bpy.data.node_groups:
-            for node in ng.nodes:
-                if (node.type == 'TEX_IMAGE' and 
-                    hasattr(node, 'image') and 
-                    node.image == old_img):
-                    node.image = new_img
-        
-        # Remap in world shaders
-        for world in bpy.data.worlds:
-            if world.node_tree:
-                for node in world.node_tree.nodes:
-                    if (node.type == 'TEX_IMAGE' and 
-                        hasattr(node, 'image') and 
-                        node.image == old_img):
-                        node.image = new_img
+    DATA_INDEX = DataType.IMAGES
 
 # ============================================================================
 # REGISTRATION
@@ -1123,6 +1437,7 @@ def register():
         CLEANUP_DataOption,
         CLEANUP_ConflictItem,
         CLEANUP_OT_select_data_option,
+        CLEANUP_OT_analyze_async,
         CLEANUP_OT_clean_materials,
         CLEANUP_OT_clean_node_groups,
         CLEANUP_OT_clean_images,
@@ -1139,6 +1454,7 @@ def unregister():
         CLEANUP_OT_clean_images,
         CLEANUP_OT_clean_node_groups,
         CLEANUP_OT_clean_materials,
+        CLEANUP_OT_analyze_async,
         CLEANUP_OT_select_data_option,
         CLEANUP_ConflictItem,
         CLEANUP_DataOption,
@@ -3,6 +3,7 @@ import sys
 from bpy.types import Operator, Panel
 from bpy.props import EnumProperty, StringProperty
 from mathutils import Vector
+import numpy as np
 
 from .module_helper import ModuleManager
 
@@ -33,6 +34,9 @@ class OBJECT_OT_set_collection_offset(Operator):
         default=""
     )
 
+    # (selection size, collections) cached per operator run
+    _collections_cache = None
+
     @classmethod
     def poll(cls, context):
         return module_enabled and context.selected_objects
@@ -50,7 +54,7 @@ class OBJECT_OT_set_collection_offset(Operator):
             return {'CANCELLED'}
         
         # Get unique collections of selected objects
-        collections = set(coll for obj in selected_objects for coll in obj.users_collection)
+        collections = self.get_collections(selected_objects)
         
         if len(collections) > 1 and not self.collection_to_update:
             # Multiple collections found, but no collection specified yet
@@ -86,20 +90,30 @@ class OBJECT_OT_set_collection_offset(Operator):
         return {'FINISHED'}
 
     def invoke(self, context, event):
+        # Collect the collections once, draw runs on every redraw of the popup
+        self.get_collections(context.selected_objects)
+        
         # Always show the popup dialog to let users choose the offset type
         # and collection (if multiple collections are present)
         return context.window_manager.invoke_props_dialog(self, width=200)
 
     def draw(self, context):
         layout = self.layout
-        selected_objects = context.selected_objects
-        collections = set(coll for obj in selected_objects for coll in obj.users_collection)
+        collections = self.get_collections(context.selected_objects)
         
         if len(collections) > 1:
             layout.prop_search(self, "collection_to_update", bpy.data, "collections", text="Collection")
         
         layout.prop(self, "offset_type")
 
+    def get_collections(self, objects):
+        # Rebuilt if the selection size changed since it was cached
+        cache = self._collections_cache
+        if cache is None or cache[0] != len(objects):
+            cache = (len(objects), set(coll for obj in objects for coll in obj.users_collection))
+            self._collections_cache = cache
+        return cache[1]
+
     def get_selection_center(self, objects):
         bounds = self.get_bounds(objects)
         return (bounds[0] + bounds[1]) / 2
@@ -110,16 +124,14 @@ class OBJECT_OT_set_collection_offset(Operator):
         return Vector((center.x, center.y, bounds[0].z))
 
     def get_bounds(self, objects):
-        min_co = Vector((float('inf'),) * 3)
-        max_co = Vector((float('-inf'),) * 3)
+        # Transform all bound box corners at once: (N, 8, 3) corners, (N, 4, 4) matrices
+        corners = np.array([obj.bound_box for obj in objects], dtype=np.float64)
+        matrices = np.array([obj.matrix_world for obj in objects], dtype=np.float64)
         
-        for obj in objects:
-            for v in obj.bound_box:
-                world_co = obj.matrix_world @ Vector(v)
-                min_co = Vector(min(a, b) for a, b in zip(min_co, world_co))
-                max_co = Vector(max(a, b) for a, b in zip(max_co, world_co))
+        world_co = np.einsum('nij,nkj->nki', matrices[:, :3, :3], corners) + matrices[:, None, :3, 3]
+        world_co = world_co.reshape(-1, 3)
         
-        return min_co, max_co
+        return Vector(world_co.min(axis=0)), Vector(world_co.max(axis=0))
 
 def register():
     if not ModuleManager.register_module(sys.modules[__name__]):
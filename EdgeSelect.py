@@ -1,7 +1,9 @@
 import bpy
+import bmesh
 import sys
 from bpy.types import Operator
 from bpy.props import StringProperty, EnumProperty, BoolProperty
+import numpy as np
 
 from .module_helper import ModuleManager
 
@@ -14,11 +16,26 @@ def get_vertex_groups(self, context):
     return [(group.name, group.name, "") for group in obj.vertex_groups]
 
 def get_unused_vertex_groups(obj):
-    unused_groups = []
-    for group in obj.vertex_groups:
-        if not any(group.index in [g.group for g in v.groups] for v in obj.data.vertices):
-            unused_groups.append(group.name)
-    return unused_groups
+    # One pass over the vertices collects every group index in use
+    used_groups = set()
+    for v in obj.data.vertices:
+        for g in v.groups:
+            used_groups.add(g.group)
+    return [group.name for group in obj.vertex_groups if group.index not in used_groups]
+
+def set_edit_vertex_group(mesh, vg_index, vert_indices, assign):
+    # Write group weights through the edit-mode BMesh deform layer, so no mode switch is needed
+    bm = bmesh.from_edit_mesh(mesh)
+    deform_layer = bm.verts.layers.deform.verify()
+    bm.verts.ensure_lookup_table()
+    verts = bm.verts
+    for index in vert_indices:
+        dvert = verts[index][deform_layer]
+        if assign:
+            dvert[vg_index] = 1.0
+        elif vg_index in dvert:
+            del dvert[vg_index]
+    bmesh.update_edit_mesh(mesh, loop_triangles=False, destructive=False)
 
 class QP_OT_AssignVGroup(Operator):
     """Assign or remove selected vertices/edges to/from a vertex group, and update related modifiers if found"""
@@ -87,59 +104,63 @@ class QP_OT_AssignVGroup(Operator):
             if vg is None:
                 vg = obj.vertex_groups.new(name=vg_name)
 
-        # Switch to object mode to modify vertex groups
-        bpy.ops.object.mode_set(mode='OBJECT')
+        # Sync the edit-mode selection and weights to the mesh for reading
+        obj.update_from_editmode()
 
         # Handle assignment
         mesh = obj.data
-        assigned_verts = set(v.index for v in mesh.vertices if vg.index in [g.group for g in v.groups])
+        vg_index = vg.index
+        
+        # Mask of vertices already in the group (group weights have no foreach_get)
+        assigned_verts = np.zeros(len(mesh.vertices), dtype=bool)
+        for v in mesh.vertices:
+            for g in v.groups:
+                if g.group == vg_index:
+                    assigned_verts[v.index] = True
+                    break
         
         if is_edge_mode:
             # Process edges
-            selected_edges = [e for e in mesh.edges if e.select]
+            edge_count = len(mesh.edges)
+            edge_verts = np.empty(edge_count * 2, dtype=np.int32)
+            mesh.edges.foreach_get('vertices', edge_verts)
+            edge_select = np.empty(edge_count, dtype=bool)
+            mesh.edges.foreach_get('select', edge_select)
             
-            to_assign = []
-            to_remove = []
-            all_assigned = True
-
-            for edge in selected_edges:
-                v1, v2 = edge.vertices
-                if v1 in assigned_verts and v2 in assigned_verts:
-                    to_remove.extend([v1, v2])
-                else:
-                    all_assigned = False
-                    if v1 not in assigned_verts or v2 not in assigned_verts:
-                        to_assign.extend([v1, v2])
-
-            if not all_assigned and to_assign:
-                vg.add(to_assign, 1.0, 'REPLACE')
-                self.report({'INFO'}, f"Assigned {len(to_assign)//2} edges to {vg_name} group")
-            elif all_assigned and to_remove:
-                vg.remove(to_remove)
-                self.report({'INFO'}, f"Removed {len(to_remove)//2} edges from {vg_name} group")
+            selected_edges = edge_verts.reshape(-1, 2)[edge_select]
+            both_assigned = assigned_verts[selected_edges[:, 0]] & assigned_verts[selected_edges[:, 1]]
+            
+            # Edges share endpoints, so each vertex is written once
+            assign_edges = selected_edges[~both_assigned]
+            remove_edges = selected_edges[both_assigned]
+            all_assigned = bool(both_assigned.all())
+
+            if not all_assigned and len(assign_edges):
+                set_edit_vertex_group(mesh, vg_index, np.unique(assign_edges).tolist(), True)
+                self.report({'INFO'}, f"Assigned {len(assign_edges)} edges to {vg_name} group")
+            elif all_assigned and len(remove_edges):
+                set_edit_vertex_group(mesh, vg_index, np.unique(remove_edges).tolist(), False)
+                self.report({'INFO'}, f"Removed {len(remove_edges)} edges from {vg_name} group")
             else:
                 self.report({'INFO'}, f"No changes made to {vg_name} group")
                 
         elif is_vert_mode:
             # Process vertices
-            selected_verts = [v.index for v in mesh.vertices if v.select]
+            vert_select = np.empty(len(mesh.vertices), dtype=bool)
+            mesh.vertices.foreach_get('select', vert_select)
             
-            to_assign = []
-            to_remove = []
-            all_assigned = True
+            selected_verts = np.flatnonzero(vert_select)
+            selected_assigned = assigned_verts[selected_verts]
             
-            for v_idx in selected_verts:
-                if v_idx in assigned_verts:
-                    to_remove.append(v_idx)
-                else:
-                    all_assigned = False
-                    to_assign.append(v_idx)
+            to_assign = selected_verts[~selected_assigned].tolist()
+            to_remove = selected_verts[selected_assigned].tolist()
+            all_assigned = bool(selected_assigned.all())
                     
             if not all_assigned and to_assign:
-                vg.add(to_assign, 1.0, 'REPLACE')
+                set_edit_vertex_group(mesh, vg_index, to_assign, True)
                 self.report({'INFO'}, f"Assigned {len(to_assign)} vertices to {vg_name} group")
             elif all_assigned and to_remove:
-                vg.remove(to_remove)
+                set_edit_vertex_group(mesh, vg_index, to_remove, False)
                 self.report({'INFO'}, f"Removed {len(to_remove)} vertices from {vg_name} group")
             else:
                 self.report({'INFO'}, f"No changes made to {vg_name} group")
@@ -168,6 +189,8 @@ class QP_OT_AssignVGroup(Operator):
 
         # Remove unused vertex groups if option is selected
         if self.remove_unused_groups:
+            # Pick up the weights just written to the edit mesh
+            obj.update_from_editmode()
             unused_groups = get_unused_vertex_groups(obj)
             for group_name in unused_groups:
                 group = obj.vertex_groups.get(group_name)
@@ -175,9 +198,6 @@ class QP_OT_AssignVGroup(Operator):
                     obj.vertex_groups.remove(group)
             self.report({'INFO'}, f"Removed {len(unused_groups)} unused vertex groups.")
 
-        # Switch back to edit mode
-        bpy.ops.object.mode_set(mode='EDIT')
-
         return {'FINISHED'}
 
 def register():
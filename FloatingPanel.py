@@ -5,10 +5,10 @@ Floating Panel - Create floating viewport windows.
 Simple workflow:
 1. Split active area to sidebar width + padding
 2. Wait for UI refresh
-3. Duplicate the new area (areas[-1])
-4. Configure the duplicated viewport (hide tools, show N panel, etc.)
-5. Wait for UI refresh
-6. Close the split area
+3. Duplicate the new area (areas[-1]) and configure the duplicated
+   viewport (hide tools, show N panel, etc.)
+4. Wait for UI refresh
+5. Close the split area
 """
 import bpy
 import sys
@@ -24,6 +24,12 @@ _is_registered = False
 # Padding to add to sidebar width
 SIDEBAR_PADDING = 20
 
+# Asset shelf region toggle (Blender 4.0+); the Blender version is fixed for a session
+_HAS_ASSET_SHELF = 'show_region_asset_shelf' in bpy.types.SpaceView3D.bl_rna.properties
+
+# WINDOW regions keyed by area pointer, only valid during one operator run
+_region_cache = {}
+
 
 def get_sidebar_width(area):
     """Get the width of the sidebar (N-panel) in the given area."""
@@ -34,11 +40,15 @@ def get_sidebar_width(area):
 
 
 def get_window_region(area):
-    """Get the WINDOW region from an area."""
-    for region in area.regions:
-        if region.type == 'WINDOW':
-            return region
-    return area.regions[0] if area.regions else None
+    """Get the WINDOW region from an area (cached per area while the operator runs)."""
+    key = area.as_pointer()
+    region = _region_cache.get(key)
+    if region is None:
+        region = next((r for r in area.regions if r.type == 'WINDOW'), None)
+        if region is None:
+            region = area.regions[0] if area.regions else None
+        _region_cache[key] = region
+    return region
 
 
 def configure_floating_viewport(window):
@@ -69,7 +79,7 @@ def configure_floating_viewport(window):
                 # Hide header
                 space.show_region_header = False
                 # Hide asset shelf
-                if hasattr(space, 'show_region_asset_shelf'):
+                if _HAS_ASSET_SHELF:
                     space.show_region_asset_shelf = False
                 return True
     return False
@@ -94,7 +104,7 @@ class QP_OT_FloatingPanel(Operator):
     _timer = None
     _main_window = None
     _new_area_index = -1
-    _step = 0  # 1=duplicate, 2=configure, 3=close
+    _step = 0  # 1=duplicate and configure, 2=close
     _windows_before = None
 
     @classmethod
@@ -109,6 +119,9 @@ class QP_OT_FloatingPanel(Operator):
             self.report({'ERROR'}, "Must be invoked from a 3D View")
             return {'CANCELLED'}
 
+        # Regions from an earlier run may have been freed since
+        _region_cache.clear()
+
         # Store main window and window count before duplicate
         self._main_window = context.window
         self._windows_before = set(w.as_pointer() for w in context.window_manager.windows)
@@ -153,13 +166,10 @@ class QP_OT_FloatingPanel(Operator):
             return {'PASS_THROUGH'}
 
         if self._step == 1:
-            # STEP 2: Duplicate the new area
+            # STEP 2: Duplicate the new area and configure the floating viewport
             return self._duplicate_area(context)
         elif self._step == 2:
-            # STEP 3: Configure the floating viewport
-            return self._configure_viewport(context)
-        elif self._step == 3:
-            # STEP 4: Close the split area
+            # STEP 3: Close the split area
             return self._close_split_area(context)
 
         return {'PASS_THROUGH'}
@@ -188,7 +198,10 @@ class QP_OT_FloatingPanel(Operator):
             self._cleanup(context)
             return {'FINISHED'}
 
-        self._step = 2  # Next step: configure viewport
+        # The new window is added while area_dupli runs, configure it right away
+        self._configure_viewport(context)
+
+        self._step = 2  # Next step: close
         return {'RUNNING_MODAL'}
 
     def _configure_viewport(self, context):
@@ -203,22 +216,23 @@ class QP_OT_FloatingPanel(Operator):
         if new_window:
             configure_floating_viewport(new_window)
 
-        self._step = 3  # Next step: close
-        return {'RUNNING_MODAL'}
-
     def _close_split_area(self, context):
         """Close the split area in the main window."""
-        self._cleanup(context)
-
         screen = self._main_window.screen if self._main_window else context.screen
 
-        if self._new_area_index < 0 or self._new_area_index >= len(screen.areas):
+        area_to_close = None
+        close_region = None
+        if 0 <= self._new_area_index < len(screen.areas):
+            area_to_close = screen.areas[self._new_area_index]
+            close_region = get_window_region(area_to_close)
+
+        # Look the region up before the cleanup drops the region cache
+        self._cleanup(context)
+
+        if area_to_close is None:
             self.report({'WARNING'}, "Could not find area to close")
             return {'FINISHED'}
 
-        area_to_close = screen.areas[self._new_area_index]
-        close_region = get_window_region(area_to_close)
-
         try:
             with context.temp_override(
                 window=self._main_window,
@@ -236,6 +250,7 @@ class QP_OT_FloatingPanel(Operator):
         if self._timer:
             context.window_manager.event_timer_remove(self._timer)
             self._timer = None
+        _region_cache.clear()
 
     def cancel(self, context):
         self._cleanup(context)
@@ -2,6 +2,7 @@ import bpy
 import sys
 from bpy.types import Operator
 from mathutils import Vector
+import numpy as np
 
 from .module_helper import ModuleManager
 
@@ -9,6 +10,24 @@ from .module_helper import ModuleManager
 module_enabled = True
 _is_registered = False
 
+# Evaluated once at import, the running Blender version can't change
+_IS_BLENDER_4_3_PLUS = bpy.app.version >= (4, 3, 0)
+
+# Object types -> (modifier collection, lattice modifier type, requires 4.3+)
+STANDARD_TYPES = frozenset({'MESH', 'CURVE', 'SURFACE', 'FONT', 'LATTICE'})
+LATTICE_MODIFIER_TYPES = (
+    (STANDARD_TYPES, 'modifiers', 'LATTICE', False),
+    (frozenset({'GREASEPENCIL'}), 'modifiers', 'GREASE_PENCIL_LATTICE', True),
+    (frozenset({'CURVES'}), 'modifiers', 'LATTICE', True),
+    (frozenset({'GPENCIL'}), 'grease_pencil_modifiers', 'GREASE_PENCIL_LATTICE', False),
+)
+
+# Standard objects, Grease Pencil (any naming) and Blender 4.3+ strokes
+COMPATIBLE_TYPES = STANDARD_TYPES | {'GREASEPENCIL', 'GPENCIL', 'CURVES'}
+
+# The lattice modifier is inserted before the first modifier of these types
+STACK_BARRIER_TYPES = frozenset({'NODES', 'GP_MODIFIER_LINEART'})
+
 class QP_OT_LatticeSetup(Operator):
     """Create a lattice around selected objects and add lattice modifiers"""
     bl_idname = "qp.lattice_setup"
@@ -21,146 +40,88 @@ class QP_OT_LatticeSetup(Operator):
 
     def get_bounds(self, objects):
         """Calculate the bounding box for all selected objects"""
-        min_co = Vector((float('inf'),) * 3)
-        max_co = Vector((float('-inf'),) * 3)
-        
+        # Preallocated for every object, filled in one pass and trimmed to the boxed count
+        count = len(objects)
+        corners = np.empty((count, 8, 3), dtype=np.float64)
+        matrices = np.empty((count, 4, 4), dtype=np.float64)
+        boxed_count = 0
+        locations = []
         for obj in objects:
-            if hasattr(obj, 'bound_box') and obj.bound_box:
-                for v in obj.bound_box:
-                    world_co = obj.matrix_world @ Vector(v)
-                    min_co = Vector(min(a, b) for a, b in zip(min_co, world_co))
-                    max_co = Vector(max(a, b) for a, b in zip(max_co, world_co))
+            matrix_world = obj.matrix_world
+            bound_box = getattr(obj, 'bound_box', None)
+            if bound_box:
+                corners[boxed_count] = bound_box
+                matrices[boxed_count] = matrix_world
+                boxed_count += 1
             else:
-                loc = obj.matrix_world.translation
-                min_co = Vector(min(a, b) for a, b in zip(min_co, loc))
-                max_co = Vector(max(a, b) for a, b in zip(max_co, loc))
+                locations.append(matrix_world.translation[:])
+        
+        world_co = [np.array(locations, dtype=np.float64).reshape(-1, 3)]
         
-        return min_co, max_co
+        if boxed_count:
+            # Transform all bound box corners at once: (N, 8, 3) corners, (N, 4, 4) matrices
+            corners = corners[:boxed_count]
+            matrices = matrices[:boxed_count]
+            transformed = np.einsum('nij,nkj->nki', matrices[:, :3, :3], corners) + matrices[:, None, :3, 3]
+            world_co.append(transformed.reshape(-1, 3))
+        
+        world_co = np.concatenate(world_co)
+        return Vector(world_co.min(axis=0)), Vector(world_co.max(axis=0))
 
     def is_compatible(self, obj):
         """Check if object can have a lattice modifier"""
-        standard_types = {'MESH', 'CURVE', 'SURFACE', 'FONT', 'LATTICE'}
-        
-        # Standard objects
-        if obj.type in standard_types:
-            return True
-            
-        # Grease Pencil objects (any naming)
-        if obj.type in {'GREASEPENCIL', 'GPENCIL'}:
-            return True
-            
-        # Blender 4.3+ Grease Pencil strokes
-        if obj.type == 'CURVES':
-            return True
-            
-        return False
+        return obj.type in COMPATIBLE_TYPES
 
     def add_lattice_modifier(self, obj, lattice_obj):
         """Add lattice modifier based on object type and Blender version"""
-        is_blender_4_3_plus = bpy.app.version >= (4, 3, 0)
-        
-        # Store the current active object to restore later
-        current_active = bpy.context.view_layer.objects.active
+        for object_types, collection_attr, modifier_type, needs_4_3 in LATTICE_MODIFIER_TYPES:
+            if obj.type in object_types:
+                break
+        else:
+            return False
         
-        # Set this object as active to ensure modifier operators work correctly
-        bpy.context.view_layer.objects.active = obj
+        if needs_4_3 and not _IS_BLENDER_4_3_PLUS:
+            return False
         
-        # Find the index of the first Geometry Nodes modifier, if any
-        geo_node_index = -1
-        for i, mod in enumerate(obj.modifiers):
-            if mod.type == 'NODES':
-                geo_node_index = i
-                break
+        modifiers = getattr(obj, collection_attr, None)
+        if modifiers is None:
+            return False
         
         try:
-            # Standard objects - consistent across versions
-            if obj.type in {'MESH', 'CURVE', 'SURFACE', 'FONT', 'LATTICE'}:
-                try:
-                    modifier = obj.modifiers.new(name="Lattice", type='LATTICE')
-                    if modifier:
-                        modifier.object = lattice_obj
-                        
-                        # Move before geometry nodes if needed
-                        if geo_node_index >= 0:
-                            # For each position after the geo nodes, move up once
-                            for i in range(len(obj.modifiers) - 1, geo_node_index, -1):
-                                if obj.modifiers[i].name == modifier.name:
-                                    bpy.ops.object.modifier_move_up(modifier=modifier.name)
-                        
-                        return True
-                except Exception as e:
-                    print(f"Error adding standard lattice modifier: {e}")
-                    return False
+            # Find the index of the first Geometry Nodes (or Line Art) modifier, if any
+            geo_node_index = next(
+                (i for i, mod in enumerate(modifiers) if mod.type in STACK_BARRIER_TYPES), -1)
             
-            # Grease Pencil in Blender 4.3+
-            elif is_blender_4_3_plus and obj.type == 'GREASEPENCIL':
-                try:
-                    # For Grease Pencil in 4.3+, use 'GREASE_PENCIL_LATTICE' type
-                    modifier = obj.modifiers.new(name="Lattice", type='GREASE_PENCIL_LATTICE')
-                    if modifier:
-                        modifier.object = lattice_obj
-                        
-                        # Move before geometry nodes if needed
-                        if geo_node_index >= 0:
-                            # For each position after the geo nodes, move up once
-                            for i in range(len(obj.modifiers) - 1, geo_node_index, -1):
-                                if obj.modifiers[i].name == modifier.name:
-                                    bpy.ops.object.modifier_move_up(modifier=modifier.name)
-                        
-                        return True
-                except Exception as e:
-                    print(f"Error adding Blender 4.3+ GP lattice modifier: {e}")
-                    return False
-                    
-            # Curves or other objects in 4.3+
-            elif is_blender_4_3_plus and obj.type == 'CURVES':
-                try:
-                    modifier = obj.modifiers.new(name="Lattice", type='LATTICE')
-                    if modifier:
-                        modifier.object = lattice_obj
-                        
-                        # Move before geometry nodes if needed
-                        if geo_node_index >= 0:
-                            # For each position after the geo nodes, move up once
-                            for i in range(len(obj.modifiers) - 1, geo_node_index, -1):
-                                if obj.modifiers[i].name == modifier.name:
-                                    bpy.ops.object.modifier_move_up(modifier=modifier.name)
-                        
-                        return True
-                except Exception as e:
-                    print(f"Error adding Blender 4.3+ CURVES lattice modifier: {e}")
-                    return False
-                    
-            # Legacy Grease Pencil (4.1-4.2)
-            elif obj.type in {'GPENCIL'} and hasattr(obj, 'grease_pencil_modifiers'):
-                try:
-                    modifier = obj.grease_pencil_modifiers.new(name="Lattice", type='GREASE_PENCIL_LATTICE')
-                    if modifier:
-                        modifier.object = lattice_obj
-                        
-                        # For GP modifiers we need to check the grease_pencil_modifiers collection
-                        gp_geo_node_index = -1
-                        for i, mod in enumerate(obj.grease_pencil_modifiers):
-                            if mod.type == 'GP_MODIFIER_LINEART' or "NODES" in mod.type:
-                                gp_geo_node_index = i
-                                break
-                        
-                        if gp_geo_node_index >= 0:
-                            # Move modifier up in GP stack
-                            for i in range(len(obj.grease_pencil_modifiers) - 1, gp_geo_node_index, -1):
-                                if obj.grease_pencil_modifiers[i].name == modifier.name:
-                                    bpy.ops.object.gpencil_modifier_move_up(modifier=modifier.name)
-                        
-                        return True
-                except Exception as e:
-                    print(f"Error adding legacy GP lattice modifier: {e}")
-                    return False
-                    
+            modifier = modifiers.new(name="Lattice", type=modifier_type)
+            if not modifier:
+                return False
+            modifier.object = lattice_obj
+            
+            # Move before geometry nodes if needed, in one call
+            if geo_node_index >= 0:
+                self.move_modifier(obj, modifiers, modifier, geo_node_index)
+            
+            return True
+        
+        except Exception as e:
+            print(f"Error adding {modifier_type} modifier to {obj.name}: {e}")
             return False
+
+    def move_modifier(self, obj, modifiers, modifier, target_index):
+        """Move a newly added modifier from the end of the stack up to target_index"""
+        if hasattr(modifiers, 'move'):
+            modifiers.move(len(modifiers) - 1, target_index)
+            return
         
+        # Legacy GP modifiers have no collection move, fall back to the operator
+        view_layer = bpy.context.view_layer
+        current_active = view_layer.objects.active
+        view_layer.objects.active = obj
+        try:
+            for _ in range(len(modifiers) - 1 - target_index):
+                bpy.ops.object.gpencil_modifier_move_up(modifier=modifier.name)
         finally:
-            # Restore the original active object
-            bpy.context.view_layer.objects.active = current_active
+            view_layer.objects.active = current_active
 
     def execute(self, context):
         selected_objects = context.selected_objects
@@ -169,9 +130,11 @@ class QP_OT_LatticeSetup(Operator):
             self.report({'ERROR'}, "No objects selected")
             return {'CANCELLED'}
 
-        # Find compatible objects
-        compatible_objects = [obj for obj in selected_objects if self.is_compatible(obj)]
-        incompatible_objects = [obj for obj in selected_objects if obj not in compatible_objects]
+        # Split compatible and incompatible objects in one pass
+        compatible_objects = []
+        incompatible_objects = []
+        for obj in selected_objects:
+            (compatible_objects if self.is_compatible(obj) else incompatible_objects).append(obj)
         
         if not compatible_objects:
             self.report({'ERROR'}, "No compatible objects selected. Lattices can be applied to Mesh, Curve, Surface, Text, Lattice, and Grease Pencil objects.")
@@ -186,50 +149,18 @@ class QP_OT_LatticeSetup(Operator):
         context.scene.collection.objects.link(lattice_obj)
         
         # Calculate dimensions
-        dimensions = max_co - min_co
-        
-        # Handle zero or near-zero dimensions
-        min_dimension = 0.001  # Minimum dimension to prevent zero scale
-        original_dimensions = dimensions.copy()  # Store original dimensions for center calculation
+        dimensions = np.array(max_co - min_co)
         
-        # Track which axes were adjusted for centering calculation
-        adjusted_axes = [False, False, False]  # x, y, z
-        
-        # Check for near-zero dimensions and set appropriate resolution
-        if dimensions.x < min_dimension:
-            lattice_data.points_u = 1  # Set resolution to 1 for x-axis
-            dimensions.x = 1.0  # Set dimension to 1.0 instead of zero/near-zero
-            adjusted_axes[0] = True
-        else:
-            lattice_data.points_u = 2  # Default resolution for x-axis
-            
-        if dimensions.y < min_dimension:
-            lattice_data.points_v = 1  # Set resolution to 1 for y-axis
-            dimensions.y = 1.0  # Set dimension to 1.0 instead of zero/near-zero
-            adjusted_axes[1] = True
-        else:
-            lattice_data.points_v = 2  # Default resolution for y-axis
-            
-        if dimensions.z < min_dimension:
-            lattice_data.points_w = 1  # Set resolution to 1 for z-axis
-            dimensions.z = 1.0  # Set dimension to 1.0 instead of zero/near-zero
-            adjusted_axes[2] = True
-        else:
-            lattice_data.points_w = 2  # Default resolution for z-axis
+        # Near-zero axes get a resolution of 1 and a unit dimension to prevent zero scale
+        min_dimension = 0.001
+        adjusted_axes = dimensions < min_dimension
+        lattice_data.points_u, lattice_data.points_v, lattice_data.points_w = np.where(adjusted_axes, 1, 2).tolist()
         
         # Apply dimensions
-        lattice_obj.dimensions = dimensions
-        
-        # Calculate center position correctly for adjusted axes
-        center_position = Vector((0, 0, 0))
+        lattice_obj.dimensions = Vector(np.where(adjusted_axes, 1.0, dimensions))
         
-        for i, axis in enumerate(['x', 'y', 'z']):
-            if adjusted_axes[i]:
-                # For adjusted axes, use the average of min and max
-                center_position[i] = (getattr(min_co, axis) + getattr(max_co, axis)) / 2
-            else:
-                # For normal axes, use the standard calculation
-                center_position[i] = getattr(min_co, axis) + getattr(original_dimensions, axis) / 2
+        # The bounds midpoint is the center on every axis, adjusted or not
+        center_position = (min_co + max_co) / 2
         
         # Handle rotation - if only one compatible object is selected, match its rotation
         if len(compatible_objects) == 1:
@@ -259,23 +190,16 @@ class QP_OT_LatticeSetup(Operator):
                     # Add margin around the object (10% on each side)
                     margin = 1.1
                     
-                    local_dims = single_obj.dimensions
+                    local_dims = np.array(single_obj.dimensions)
                     
                     # Handle zero dimensions
-                    if local_dims.x < min_dimension:
-                        lattice_data.points_u = 1
-                        local_dims.x = 1.0
-                    
-                    if local_dims.y < min_dimension:
-                        lattice_data.points_v = 1
-                        local_dims.y = 1.0
-                    
-                    if local_dims.z < min_dimension:
-                        lattice_data.points_w = 1
-                        local_dims.z = 1.0
+                    flat_axes = local_dims < min_dimension
+                    if flat_axes.any():
+                        points = np.array((lattice_data.points_u, lattice_data.points_v, lattice_data.points_w))
+                        lattice_data.points_u, lattice_data.points_v, lattice_data.points_w = np.where(flat_axes, 1, points).tolist()
                     
                     # Apply scaled dimensions
-                    lattice_obj.dimensions = local_dims * margin
+                    lattice_obj.dimensions = Vector(np.where(flat_axes, 1.0, local_dims) * margin)
                 else:
                     # If we can't get object dimensions, use the calculated dimensions
                     lattice_obj.location = center_position
@@ -297,8 +221,7 @@ class QP_OT_LatticeSetup(Operator):
                 failed_objects.append(obj)
         
         # Select the lattice for easier manipulation
-        for obj in context.selected_objects:
-            obj.select_set(False)
+        bpy.ops.object.select_all(action='DESELECT')
         lattice_obj.select_set(True)
         context.view_layer.objects.active = lattice_obj
         
@@ -1,6 +1,7 @@
 import bpy
 import sys
 import re
+from functools import lru_cache
 from bpy.types import Operator
 
 from .module_helper import ModuleManager
@@ -9,6 +10,54 @@ from .module_helper import ModuleManager
 module_enabled = True
 _is_registered = False
 
+# Suffix map for image texture matching (lowercase), checked in order (first match wins)
+SUFFIX_MAP = {
+    "Color": ["albedo", "color", "col", "colour", "base color", "diffuse", "diff", "dif"],
+    "AO": ["ao", "ambientocclusion"],
+    "Metallic": ["metallic", "metal", "met"],
+    "Roughness": ["roughness", "rough"],
+    "Height": ["displacement", "height", "disp"],
+    "Normal": ["normal", "nor", "norm"],
+    "Alpha": ["opacity", "alpha"],
+    "Curvature": ["curvature", "curv"],
+}
+
+# One compiled alternation per output, so each output costs a single scan of the name
+_SUFFIX_PATTERNS = tuple(
+    (output_name, re.compile("|".join(re.escape(suffix) for suffix in suffixes)))
+    for output_name, suffixes in SUFFIX_MAP.items()
+)
+
+# Common alternative mappings for PBR workflows
+NAME_ALTERNATIVES = {
+    "color": ["base color", "basecolor", "diffuse"],
+    "base color": ["color", "basecolor"],
+    "basecolor": ["color", "base color"],
+    "height": ["displacement"],
+    "displacement": ["height"],
+}
+
+@lru_cache(maxsize=512)
+def normalize_name(name):
+    """Lowercase a socket name and drop separators"""
+    return name.lower().replace('_', '').replace(' ', '').replace('-', '')
+
+@lru_cache(maxsize=512)
+def extract_tokens(name):
+    """Extract meaningful words from a name, removing separators and extensions"""
+    # Remove file extension
+    name = name.rsplit('.', 1)[0]
+    # Split by common separators and filter out very short/numeric tokens
+    tokens = re.split(r'[_\-\s.]+', name.lower())
+    # Filter out short tokens (likely IDs) and purely numeric
+    return frozenset(t for t in tokens if len(t) > 2 and not t.isdigit())
+
+# Normalized alternatives, keyed by normalized output name
+_NORMALIZED_ALTERNATIVES = {
+    name: frozenset(normalize_name(alt) for alt in alternatives)
+    for name, alternatives in NAME_ALTERNATIVES.items()
+}
+
 class NodeGroupLinker(Operator):
     """Link node groups to nodes based on matching socket names"""
     bl_idname = "node.node_group_linker"  
@@ -29,25 +78,17 @@ class NodeGroupLinker(Operator):
         # Remove the active node from the list of nodes to link
         other_nodes = [node for node in nodes if node != active_node]
 
-        # Define the suffix map for image texture matching
-        self.suffix_map = {
-            "Color": ["albedo", "color", "col", "colour", "base color", "diffuse", "diff", "dif"],
-            "AO": ["ao", "ambientocclusion"],
-            "Metallic": ["metallic", "metal", "met"],
-            "Roughness": ["roughness", "rough"],
-            "Height": ["displacement", "height", "disp"],
-            "Normal": ["normal", "nor", "norm"],
-            "Alpha": ["opacity", "alpha"],
-            "Curvature": ["curvature", "curv"],
-        }
-
         links_made = False
 
+        # Invariant for the whole run, resolved once instead of per output socket
+        edit_tree = context.space_data.edit_tree
+        is_bsdf_node = active_node.bl_idname.lower().startswith("shadernodebsdf")
+
         for node in other_nodes:
             if node.type == 'TEX_IMAGE':
-                links_made |= self.link_image_texture(context, node, active_node)
+                links_made |= self.link_image_texture(edit_tree, node, active_node, is_bsdf_node)
             else:
-                links_made |= self.link_nodes(context, active_node, [node])
+                links_made |= self.link_nodes(edit_tree, active_node, [node], is_bsdf_node)
 
         if not links_made:
             self.report({'INFO'}, "No matching or available sockets found for linking.")
@@ -56,33 +97,14 @@ class NodeGroupLinker(Operator):
 
         return {'FINISHED'}
 
-    def extract_tokens(self, name):
-        """Extract meaningful words from a name, removing separators and extensions"""
-        # Remove file extension
-        name = name.rsplit('.', 1)[0]
-        # Split by common separators and filter out very short/numeric tokens
-        tokens = re.split(r'[_\-\s.]+', name.lower())
-        # Filter out short tokens (likely IDs) and purely numeric
-        return [t for t in tokens if len(t) > 2 and not t.isdigit()]
-
     def find_best_socket_match(self, output_name, active_node):
         """Find the best matching input socket with strict matching rules"""
-        # Common alternative mappings for PBR workflows
-        name_alternatives = {
-            "color": ["base color", "basecolor", "diffuse"],
-            "base color": ["color", "basecolor"],
-            "basecolor": ["color", "base color"],
-            "height": ["displacement"],
-            "displacement": ["height"],
-        }
-        
-        output_tokens = set(self.extract_tokens(output_name))
-        output_normalized = output_name.lower().replace('_', '').replace(' ', '').replace('-', '')
+        # Tokens and normalized names are cached, socket names repeat on every call
+        output_tokens = extract_tokens(output_name)
+        output_normalized = normalize_name(output_name)
         
-        # Get alternative names to check
-        search_names = [output_name.lower()]
-        if output_normalized in name_alternatives:
-            search_names.extend(name_alternatives[output_normalized])
+        # Normalized name plus its alternatives, built once before the input loop
+        search_names = _NORMALIZED_ALTERNATIVES.get(output_normalized, frozenset()) | {output_normalized}
         
         best_match = None
         best_score = 0
@@ -91,13 +113,14 @@ class NodeGroupLinker(Operator):
             if input_socket.is_linked:
                 continue
                 
-            input_tokens = set(self.extract_tokens(input_socket.name))
-            input_normalized = input_socket.name.lower().replace('_', '').replace(' ', '').replace('-', '')
+            input_name = input_socket.name
+            input_tokens = extract_tokens(input_name)
+            input_normalized = normalize_name(input_name)
             
             score = 0
             
             # Priority 1: Exact normalized match or in alternatives
-            if input_normalized in [n.replace(' ', '').replace('_', '').replace('-', '') for n in search_names]:
+            if input_normalized in search_names:
                 score = 1000
             
             # Priority 2: Input name tokens are ALL contained in output tokens
@@ -114,12 +137,15 @@ class NodeGroupLinker(Operator):
                         continue
             
             if score > best_score:
+                # Nothing outranks an exact match and ties keep the first socket
+                if score >= 1000:
+                    return input_socket
                 best_score = score
                 best_match = input_socket
         
         return best_match
 
-    def link_image_texture(self, context, image_node, active_node):
+    def link_image_texture(self, edit_tree, image_node, active_node, is_bsdf_node):
         if not image_node.image:
             return False
         
@@ -131,35 +157,34 @@ class NodeGroupLinker(Operator):
         if output_name:
             color_output = image_node.outputs.get('Color')
             if color_output:
-                return self.link_output_to_input(context, color_output, active_node, output_name)
+                return self.link_output_to_input(edit_tree, color_output, active_node, output_name, is_bsdf_node)
         
         # Fallback: use the image name directly for token-based matching
-        # This catches textures like "Curvature" that aren't in suffix_map
+        # This catches textures like "Curvature" that aren't in SUFFIX_MAP
         color_output = image_node.outputs.get('Color')
         if color_output:
-            return self.link_output_to_input(context, color_output, active_node, image_name)
+            return self.link_output_to_input(edit_tree, color_output, active_node, image_name, is_bsdf_node)
 
         return False
 
     def find_matching_suffix(self, name):
-        for output_name, suffixes in self.suffix_map.items():
-            if any(suffix.lower() in name for suffix in suffixes):
+        for output_name, pattern in _SUFFIX_PATTERNS:
+            if pattern.search(name):
                 return output_name
         return None
 
-    def link_nodes(self, context, active_node, nodes):
+    def link_nodes(self, edit_tree, active_node, nodes, is_bsdf_node):
         links_made = False
         for node in nodes:
             for output in node.outputs:
-                links_made |= self.link_output_to_input(context, output, active_node, output.name)
+                links_made |= self.link_output_to_input(edit_tree, output, active_node, output.name, is_bsdf_node)
         return links_made
 
-    def link_output_to_input(self, context, output, active_node, output_name):
-        edit_tree = context.space_data.edit_tree
-        is_bsdf_node = active_node.bl_idname.lower().startswith("shadernodebsdf")
+    def link_output_to_input(self, edit_tree, output, active_node, output_name, is_bsdf_node):
+        output_name_lower = output_name.lower()
 
         # Skip Alpha to BSDF shader connections
-        if "alpha" in output_name.lower() and is_bsdf_node:
+        if is_bsdf_node and "alpha" in output_name_lower:
             print(f"Skipping Alpha to BSDF shader connection for {active_node.name}")
             return False
 
@@ -168,7 +193,7 @@ class NodeGroupLinker(Operator):
         
         if matched_input:
             # Handle Normal map special case
-            if "normal" in output_name.lower() and is_bsdf_node:
+            if is_bsdf_node and "normal" in output_name_lower:
                 normal_map_node = edit_tree.nodes.new('ShaderNodeNormalMap')
                 normal_map_node.location = ((output.node.location.x + active_node.location.x) / 2,
                                             (output.node.location.y + active_node.location.y) / 2)
@@ -1,6 +1,6 @@
 import bpy
 import sys
-import time
+from bpy.app.handlers import persistent
 from bpy.props import StringProperty, BoolProperty
 from bpy.types import Operator, PropertyGroup
 
@@ -13,88 +13,143 @@ _is_registered = False
 # Tracks last known selected node group name for change detection
 _last_selected_ng = None
 
-# Module-level cache for node group materials
-_node_group_materials_cache = {}  # {node_group_name: {"materials": set(), "timestamp": time.time()}}
-_cache_lifetime = 60  # Cache lifetime in seconds
+# Module-level cache for node group materials, cleared on material/node tree updates
+_node_group_materials_cache = {}  # {node_group_name: frozenset(materials)}
+
+# Node groups (by session_uid) with no material nodes or nested groups, only node tree
+# edits can change that, so material updates leave this set alone
+_material_free_node_groups = set()
+
+# Material input socket identifiers of each node group's Group Input node
+_node_group_material_sockets_cache = {}  # {node_group_name: tuple(socket_identifiers)}
+
+# Material -> objects using it through geometry nodes, built on demand by
+# MATERIAL_OT_select_linked_objects, dropped when objects (and their modifiers) change
+_material_users_index = None  # {material: [objects]}
 
 def invalidate_node_group_cache():
-    """Invalidate the node group materials cache"""
-    global _node_group_materials_cache
+    """Invalidate the node group materials cache and the caches derived from it"""
+    global _material_users_index
     _node_group_materials_cache.clear()
-
-def find_materials_in_node_group(node_group, processed_groups=None):
+    _node_group_material_sockets_cache.clear()
+    _material_users_index = None
+
+def get_node_group_material_sockets(node_group):
+    """Return the identifiers of the material inputs exposed by a node group"""
+    socket_ids = _node_group_material_sockets_cache.get(node_group.name)
+    if socket_ids is None:
+        socket_ids = tuple(
+            socket.identifier
+            for node in node_group.nodes if node.type == 'GROUP_INPUT'
+            for socket in node.outputs if socket.type == 'MATERIAL'
+        )
+        _node_group_material_sockets_cache[node_group.name] = socket_ids
+    return socket_ids
+
+# Object types that can use materials: regular geometry, plus Grease Pencil and curves
+_REGULAR_MATERIAL_TYPES = frozenset({'MESH', 'CURVE', 'SURFACE', 'META', 'FONT', 'VOLUME'})
+_SLOTTED_TYPES = _REGULAR_MATERIAL_TYPES | {'GPENCIL', 'GREASEPENCIL', 'CURVES', 'POINTCLOUD'}
+
+# Node types that reference materials, through a material property or input sockets
+_MATERIAL_NODE_TYPES = frozenset({
+    'SET_MATERIAL', 'REPLACE_MATERIAL', 'MATERIAL_SELECTION', 'INPUT_MATERIAL',
+    'SET_MATERIAL_INDEX', 'INPUT_MATERIAL_INDEX', 'OUTPUT_MATERIAL',
+})
+
+def find_materials_in_node_group(node_group):
     """Find all materials referenced in a node group and its nested groups
     
     Args:
         node_group: The node group to search
-        processed_groups: Set of already processed groups to avoid infinite recursion
         
     Returns:
-        Set of materials referenced in the node group
+        Frozenset of materials referenced in the node group
     """
-    global _node_group_materials_cache
-    
-    # Check if result is in cache and still fresh
-    if node_group.name in _node_group_materials_cache:
-        cache_entry = _node_group_materials_cache[node_group.name]
-        if time.time() - cache_entry["timestamp"] < _cache_lifetime:
-            # If cache is still valid, check if node group has been modified 
-            # (we could add modification timestamp check here)
-            return cache_entry["materials"].copy()
+    # Fast path: groups without any material-capable node never need a scan
+    if node_group.session_uid in _material_free_node_groups:
+        return frozenset()
     
-    if processed_groups is None:
-        processed_groups = set()
+    # Entries stay valid until a material or node tree update clears the cache
+    cached = _node_group_materials_cache.get(node_group.name)
+    if cached is not None:
+        return cached
     
-    # Avoid processing the same group multiple times (prevents infinite recursion)
-    if node_group in processed_groups:
-        return set()
-    
-    processed_groups.add(node_group)
     materials = set()
+    has_material_nodes = False
     
-    # Check all nodes in the group
-    for node in node_group.nodes:
-        # Case 1: Material nodes (like Set Material, Material Output, etc.)
-        node_name = node.name.lower() if hasattr(node, "name") else ""
-        node_type = node.type.lower() if hasattr(node, "type") else ""
-        
-        # Check for various material nodes by type and name
-        if (node_type == 'set_material' or 
-            'material' in node_type or 
-            'set_material' in node_name or 
-            'material' in node_name):
+    # Walk nested groups with an explicit stack, each group visited once by pointer
+    stack = [node_group]
+    visited = set()
+    while stack:
+        group = stack.pop()
+        pointer = group.as_pointer()
+        if pointer in visited:
+            continue
+        visited.add(pointer)
+        
+        # Check all nodes in the group
+        for node in group.nodes:
+            node_type = node.type
             
-            # Try various ways to get material references
-            if hasattr(node, "material") and node.material:
-                materials.add(node.material)
+            # Case 1: Material nodes (like Set Material, Material Output, etc.)
+            if node_type in _MATERIAL_NODE_TYPES:
+                has_material_nodes = True
+                
+                # Material property (e.g. the Material input node)
+                node_material = getattr(node, "material", None)
+                if node_material:
+                    materials.add(node_material)
+                
+                # Only material sockets can hold a material reference
+                for input in node.inputs:
+                    if input.type == 'MATERIAL':
+                        default_value = input.default_value
+                        if default_value is not None:
+                            materials.add(default_value)
             
-            # Check inputs for material references
-            for input in node.inputs:
-                if ('material' in input.name.lower() and
-                    hasattr(input, "default_value") and 
-                    input.default_value and
-                    hasattr(input.default_value, "__class__") and
-                    "Material" in input.default_value.__class__.__name__):
-                    materials.add(input.default_value)
-        
-        # Case 2: Nested node groups - recursive search
-        elif node.type == 'GROUP' and node.node_tree:
-            nested_materials = find_materials_in_node_group(node.node_tree, processed_groups)
-            materials.update(nested_materials)
+            # Case 2: Nested node groups, reuse their cached result when there is one
+            elif node_type == 'GROUP' and node.node_tree:
+                has_material_nodes = True
+                nested_materials = _node_group_materials_cache.get(node.node_tree.name)
+                if nested_materials is not None:
+                    materials.update(nested_materials)
+                else:
+                    stack.append(node.node_tree)
+    
+    if not has_material_nodes:
+        _material_free_node_groups.add(node_group.session_uid)
+        return frozenset()
     
     # Cache the result
-    _node_group_materials_cache[node_group.name] = {
-        "materials": materials.copy(),
-        "timestamp": time.time()
-    }
+    materials = frozenset(materials)
+    _node_group_materials_cache[node_group.name] = materials
     
     return materials
 
 
 def invalidate_material_caches(self, context):
     """Invalidate caches when materials change"""
-    global _node_group_materials_cache
-    _node_group_materials_cache.clear()
+    invalidate_node_group_cache()
+
+
+@persistent
+def _on_depsgraph_update(scene, depsgraph):
+    """Handler: drop cached material lookups when materials, node trees or their users change"""
+    global _material_users_index
+    if depsgraph.id_type_updated('NODETREE'):
+        _material_free_node_groups.clear()
+        invalidate_node_group_cache()
+    elif depsgraph.id_type_updated('MATERIAL'):
+        invalidate_node_group_cache()
+    elif _material_users_index is not None and depsgraph.id_type_updated('OBJECT'):
+        _material_users_index = None
+
+
+@persistent
+def _on_load_post(_):
+    """Handler: cached materials belong to the previous file"""
+    _material_free_node_groups.clear()
+    invalidate_node_group_cache()
 
 
 def get_selected_nodegroup_from_shader_editor(context):
@@ -176,17 +231,12 @@ def draw_materials(layout, materials, search_term="", hide_linked=False, with_ac
         return
         
     # Filter materials by search term and linked status
-    filtered_materials = []
-    for mat in materials:
-        # Skip if doesn't match search term
-        if search_term and search_term.lower() not in mat.name.lower():
-            continue
-            
-        # Skip linked materials if requested
-        if hide_linked and mat.library is not None:
-            continue
-            
-        filtered_materials.append(mat)
+    search_term = search_term.lower()
+    filtered_materials = [
+        mat for mat in materials
+        if (not search_term or search_term in mat.name.lower())
+        and (not hide_linked or mat.library is None)
+    ]
     
     # Show count and empty message if needed
     if filtered_materials:
@@ -196,11 +246,8 @@ def draw_materials(layout, materials, search_term="", hide_linked=False, with_ac
         return
         
     # Get expanded state from properties
-    show_all = False
-    if hasattr(bpy.context.scene, "material_manager_props"):
-        props = bpy.context.scene.material_manager_props
-        if hasattr(props, "show_all_materials"):
-            show_all = props.show_all_materials
+    props = getattr(bpy.context.scene, "material_manager_props", None)
+    show_all = props.show_all_materials if props else False
     
     # Create a scrollable list if there are many materials
     max_display = len(filtered_materials) if show_all else min(len(filtered_materials), 20)
@@ -211,16 +258,19 @@ def draw_materials(layout, materials, search_term="", hide_linked=False, with_ac
     
     if active_object:
         # 1. Check regular material slots (object usage)
-        if hasattr(active_object, "material_slots"):
+        if active_object.type in _SLOTTED_TYPES:
             for slot in active_object.material_slots:
                 if slot.material:
                     assigned_materials[slot.material] = "object"
         
-        # 2. Check geometry nodes modifiers for nodes using materials
+        # 2. Check geometry nodes modifiers in a single pass
         for mod in active_object.modifiers:
-            if mod.type == 'NODES' and hasattr(mod, 'node_group') and mod.node_group:
+            if mod.type != 'NODES':
+                continue
+            node_group = mod.node_group
+            if node_group:
                 # Find material nodes inside the node group
-                node_group_materials = find_materials_in_node_group(mod.node_group)
+                node_group_materials = find_materials_in_node_group(node_group)
                 for mat in node_group_materials:
                     if mat in assigned_materials:
                         # If already marked as "object", now mark as "both"
@@ -228,89 +278,17 @@ def draw_materials(layout, materials, search_term="", hide_linked=False, with_ac
                             assigned_materials[mat] = "both"
                     else:
                         assigned_materials[mat] = "geonodes"
-        
-        # 3. Enhanced detection of materials directly assigned to modifier inputs
-        for mod in active_object.modifiers:
-            if mod.type == 'NODES' and hasattr(mod, 'node_group') and mod.node_group:
-                # METHOD 1: Examine all properties of the modifier
-                for prop_name in dir(mod):
-                    # Skip methods, private properties and common non-material properties
-                    if (prop_name.startswith('__') or 
-                        prop_name in {'name', 'type', 'rna_type', 'node_group', 'bl_idname'}):
-                        continue
-                    
-                    try:
-                        # Get property value
-                        prop_value = getattr(mod, prop_name)
-                        
-                        # Check if the property is a material
-                        if (prop_value and 
-                            hasattr(prop_value, 'name') and 
-                            hasattr(prop_value, 'use_nodes')):
-                            # We found a material reference
-                            if prop_value in assigned_materials:
-                                if assigned_materials[prop_value] == "object":
-                                    assigned_materials[prop_value] = "both"
-                            else:
-                                assigned_materials[prop_value] = "geonodes"
-                    except (AttributeError, TypeError):
-                        # Skip properties that can't be accessed or cause errors
-                        pass
                 
-                # METHOD 2: Check specific socket identifiers
-                for node in mod.node_group.nodes:
-                    if node.type == 'GROUP_INPUT':
-                        for socket in node.outputs:
-                            # Look for material sockets
-                            if socket.type == 'MATERIAL' or 'material' in socket.name.lower():
-                                socket_id = socket.identifier
-                                
-                                # Try three different ways to access the material
-                                
-                                # 1. Direct property access
-                                try:
-                                    if hasattr(mod, socket_id):
-                                        mat = getattr(mod, socket_id)
-                                        if (mat and
-                                            hasattr(mat, 'name') and
-                                            hasattr(mat, 'use_nodes')):
-                                            if mat in assigned_materials:
-                                                if assigned_materials[mat] == "object":
-                                                    assigned_materials[mat] = "both"
-                                            else:
-                                                assigned_materials[mat] = "geonodes"
-                                except (AttributeError, TypeError):
-                                    pass  # Property access failed
-
-                                # 2. Dictionary-style access
-                                try:
-                                    mat = mod[socket_id]
-                                    if (mat and
-                                        hasattr(mat, 'name') and
-                                        hasattr(mat, 'use_nodes')):
-                                        if mat in assigned_materials:
-                                            if assigned_materials[mat] == "object":
-                                                assigned_materials[mat] = "both"
-                                        else:
-                                            assigned_materials[mat] = "geonodes"
-                                except (KeyError, TypeError):
-                                    pass  # Dictionary access failed
-
-                                # 3. Input_ prefix (common in Blender API)
-                                try:
-                                    input_prop = f"Input_{socket_id}"
-                                    if hasattr(mod, input_prop):
-                                        mat = getattr(mod, input_prop)
-                                        if (mat and
-                                            hasattr(mat, 'name') and
-                                            hasattr(mat, 'use_nodes')):
-                                            if mat in assigned_materials:
-                                                if assigned_materials[mat] == "object":
-                                                    assigned_materials[mat] = "both"
-                                            else:
-                                                assigned_materials[mat] = "geonodes"
-                                except (AttributeError, TypeError):
-                                    pass  # Property access failed
+                # 3. Materials assigned directly to the modifier's material inputs
+                for socket_id in get_node_group_material_sockets(node_group):
+                    # Modifier inputs are ID properties keyed by socket identifier
+                    mat = mod.get(f"Input_{socket_id}") or mod.get(socket_id)
+                    if isinstance(mat, bpy.types.Material):
+                        if mat in assigned_materials:
+                            if assigned_materials[mat] == "object":
+                                assigned_materials[mat] = "both"
+                        else:
+                            assigned_materials[mat] = "geonodes"
     
     # Draw material entries
     for mat in filtered_materials[:max_display]:
@@ -327,7 +305,7 @@ def draw_materials(layout, materials, search_term="", hide_linked=False, with_ac
         row.label(text="", icon='MATERIAL')
         
         # Check if it's a Grease Pencil material
-        is_gp_material = hasattr(mat, "is_grease_pencil") and mat.is_grease_pencil
+        is_gp_material = getattr(mat, "is_grease_pencil", False)
         
         # Material name
         if is_gp_material:
@@ -472,43 +450,25 @@ class MATERIAL_OT_create_new(Operator):
         
         if selected_objects:
             for obj in selected_objects:
-                # First check for Geometry Nodes modifiers with material sockets
-                has_geonodes_mat_socket = False
-                
                 # Look for Geometry Nodes modifiers with material sockets
                 for mod in obj.modifiers:
-                    if mod.type == 'NODES' and hasattr(mod, 'node_group') and mod.node_group:
-                        # Check if the modifier has material inputs
-                        material_assigned_to_mod = False
-                        for node in mod.node_group.nodes:
-                            if node.type == 'GROUP_INPUT':
-                                for socket in node.outputs:
-                                    if socket.type == 'MATERIAL' or socket.name.lower() == 'material':
-                                        # Found a material socket, assign the material
-                                        socket_id = socket.identifier
-                                        mod[socket_id] = new_material
-                                        has_geonodes_mat_socket = True
-                                        material_assigned_to_mod = True
-                                        
-                                        # Force viewport update
-                                        mod.show_viewport = not mod.show_viewport
-                                        mod.show_viewport = not mod.show_viewport
-                                        
-                                        # Only break from the socket loop to ensure all material sockets get the material
-                                        break
-                                
-                        # Only increment counter once per modifier, not per socket
-                        if material_assigned_to_mod:
+                    if mod.type == 'NODES' and mod.node_group:
+                        socket_ids = get_node_group_material_sockets(mod.node_group)
+                        if socket_ids:
+                            # Assign to the first material input, once per modifier
+                            mod[socket_ids[0]] = new_material
                             geonodes_count += 1
                 
                 # If no Geometry Nodes material socket was found OR in addition to it,
                 # apply to the object normally
                 if len(obj.material_slots) == 0:
                     obj.data.materials.append(new_material)
-                    object_count += 1
                 else:
                     obj.active_material = new_material
-                    object_count += 1
+                object_count += 1
+                
+                # ID property writes on modifiers don't tag the object, one tag covers all of them
+                obj.update_tag()
             
             # Create appropriate status message
             if geonodes_count > 0 and object_count > 0:
@@ -541,40 +501,26 @@ class MATERIAL_OT_select_linked_objects(Operator):
     def poll(cls, context):
         return module_enabled and context.mode == 'OBJECT'
     
-    def is_grease_pencil_object(self, obj):
-        """Check if an object is a Grease Pencil object in any Blender version"""
-        # Traditional check for older Blender versions
-        if obj.type == 'GPENCIL':
-            return True
-            
-        # Check for renamed object type in Blender 4.3+
-        if obj.type == 'GREASEPENCIL':
-            return True
-            
-        # In Blender 4.3+, grease pencil became a specialized curve type
-        if obj.type == 'CURVES':
-            # Additional checks for curves that are grease pencil
-            if hasattr(obj, 'data') and hasattr(obj.data, 'curve_type'):
-                if getattr(obj.data, 'curve_type', '') == 'GREASE_PENCIL':
-                    return True
-        
-        # Additional checks for newer Blender versions (4.3+)
-        if hasattr(obj, 'data') and obj.data:
-            # Check by data type name
-            data_type = getattr(type(obj.data), '__name__', '').lower()
-            
-            # Various possible data type names
-            gp_type_names = ['gpencil', 'greasepencil', 'grease_pencil', 'curves_gpencil']
-            
-            for name in gp_type_names:
-                if name in data_type:
-                    return True
-                    
-            # Check for specific attributes that might indicate a grease pencil
-            if hasattr(obj.data, 'layers') and hasattr(obj.data, 'strokes'):
-                return True
-        
-        return False
+    def get_geonodes_materials(self, obj):
+        """Collect the materials an object's geometry nodes modifiers reference inside their node groups"""
+        materials = set()
+        for mod in obj.modifiers:
+            if mod.type == 'NODES' and mod.node_group:
+                materials |= find_materials_in_node_group(mod.node_group)
+        return materials
+
+    def get_material_users_index(self):
+        """Map each material to the objects using it through node groups, reused until the scene changes"""
+        global _material_users_index
+        
+        if _material_users_index is None:
+            index = {}
+            for obj in bpy.data.objects:
+                for mat in self.get_geonodes_materials(obj):
+                    index.setdefault(mat, []).append(obj)
+            _material_users_index = index
+        
+        return _material_users_index
 
     def execute(self, context):
         # Get the material
@@ -584,101 +530,24 @@ class MATERIAL_OT_select_linked_objects(Operator):
             return {'CANCELLED'}
         
         # Check if this is a grease pencil material
-        is_gp_material = hasattr(material, "is_grease_pencil") and material.is_grease_pencil
+        is_gp_material = getattr(material, "is_grease_pencil", False)
         
         # Clear current selection
         bpy.ops.object.select_all(action='DESELECT')
         
         selected_objects = []
         
-        # Find all objects using this material
+        # Direct users: objects or object data holding the material in a slot,
+        # and objects whose geometry nodes modifier inputs point at it.
+        # Grease Pencil strokes reference slots, so their objects are covered here too.
+        users = bpy.data.user_map(subset=[material]).get(material, set())
+        
+        # Materials referenced inside (nested) node groups only show up as node tree users
+        geonodes_users = set(self.get_material_users_index().get(material, ()))
+        
+        # Objects using this material, in bpy.data.objects order
         for obj in bpy.data.objects:
-            object_uses_material = False
-            
-            # Check grease pencil objects
-            if self.is_grease_pencil_object(obj):
-                # Check material slots for grease pencil objects
-                if hasattr(obj, 'material_slots'):
-                    for slot in obj.material_slots:
-                        if slot.material == material:
-                            object_uses_material = True
-                            break
-                
-                # For grease pencil, also check stroke material assignments
-                if not object_uses_material and hasattr(obj.data, "layers"):
-                    for layer in obj.data.layers:
-                        if hasattr(layer, 'frames') and layer.frames:
-                            try:
-                                # For older versions (pre-4.3)
-                                if hasattr(layer.frames[-1], 'strokes'):
-                                    for stroke in layer.frames[-1].strokes:
-                                        if (hasattr(stroke, 'material_index') and 
-                                            stroke.material_index < len(obj.material_slots) and
-                                            obj.material_slots[stroke.material_index].material == material):
-                                            object_uses_material = True
-                                            break
-                                # For newer Blender 4.3+ versions
-                                elif hasattr(layer.frames[-1], 'strokes_info'):
-                                    for stroke_info in layer.frames[-1].strokes_info:
-                                        if (hasattr(stroke_info, 'material_index') and 
-                                            stroke_info.material_index < len(obj.material_slots) and
-                                            obj.material_slots[stroke_info.material_index].material == material):
-                                            object_uses_material = True
-                                            break
-                                # Try with drawing elements for Blender 4.0+
-                                elif hasattr(layer, 'active_frame') and hasattr(layer.active_frame, 'drawing_elements'):
-                                    for element in layer.active_frame.drawing_elements:
-                                        if (hasattr(element, 'material_index') and 
-                                            element.material_index < len(obj.material_slots) and
-                                            obj.material_slots[element.material_index].material == material):
-                                            object_uses_material = True
-                                            break
-                            except (IndexError, AttributeError):
-                                # Continue if we encounter issues with a layer's frames
-                                continue
-                        
-                        if object_uses_material:
-                            break
-            
-            # Check regular objects (mesh, curve, surface, etc.)
-            elif obj.type in {'MESH', 'CURVE', 'SURFACE', 'META', 'FONT', 'VOLUME'}:
-                # Check material slots
-                if hasattr(obj, 'material_slots'):
-                    for slot in obj.material_slots:
-                        if slot.material == material:
-                            object_uses_material = True
-                            break
-                
-                # Also check geometry nodes modifiers for material usage
-                if not object_uses_material:
-                    for mod in obj.modifiers:
-                        if mod.type == 'NODES' and hasattr(mod, 'node_group') and mod.node_group:
-                            # Find material nodes inside the node group
-                            node_group_materials = find_materials_in_node_group(mod.node_group)
-                            if material in node_group_materials:
-                                object_uses_material = True
-                                break
-                            
-                            # Also check modifier input sockets for direct material assignment
-                            for node in mod.node_group.nodes:
-                                if node.type == 'GROUP_INPUT':
-                                    for socket in node.outputs:
-                                        if socket.type == 'MATERIAL' or socket.name.lower() == 'material':
-                                            socket_id = socket.identifier
-                                            try:
-                                                input_prop = f"Input_{socket_id}"
-                                                if hasattr(mod, input_prop):
-                                                    mat = getattr(mod, input_prop)
-                                                    if mat == material:
-                                                        object_uses_material = True
-                                                        break
-                                            except (AttributeError, TypeError):
-                                                pass  # Property access failed
-                                if object_uses_material:
-                                    break
-            
-            # Select the object if it uses the material
-            if object_uses_material:
+            if obj in users or obj.data in users or obj in geonodes_users:
                 obj.select_set(True)
                 selected_objects.append(obj.name)
         
@@ -1493,6 +1362,11 @@ def register():
 
     if not bpy.app.timers.is_registered(_sync_nodegroup_selection):
         bpy.app.timers.register(_sync_nodegroup_selection, first_interval=0.1)
+
+    if _on_depsgraph_update not in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.append(_on_depsgraph_update)
+    if _on_load_post not in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.append(_on_load_post)
     
 
 def unregister():
@@ -1514,4 +1388,12 @@ def unregister():
     ModuleManager.safe_unregister_class(MaterialManagerProperties)
 
     if bpy.app.timers.is_registered(_sync_nodegroup_selection):
-        bpy.app.timers.unregister(_sync_nodegroup_selection)
\ No newline at end of file
+        bpy.app.timers.unregister(_sync_nodegroup_selection)
+
+    if _on_depsgraph_update in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(_on_depsgraph_update)
+    if _on_load_post in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(_on_load_post)
+
+    _material_free_node_groups.clear()
+    invalidate_node_group_cache()
\ No newline at end of file
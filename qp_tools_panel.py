@@ -675,7 +675,8 @@ class QP_PT_cleanup_panel(Panel):
             materials_box.label(text=f"Found {duplicate_materials} duplicate materials")
             row = materials_box.row(align=True)
             row.scale_y = 1.5
-            row.operator("cleanup.clean_materials", text="Clean Duplicate Materials", icon='BRUSH_DATA')
+            op = row.operator("cleanup.analyze_async", text="Clean Duplicate Materials", icon='BRUSH_DATA')
+            op.data_type = 'materials'
         else:
             materials_box.label(text="No duplicate materials found", icon='CHECKMARK')
         
@@ -706,7 +707,8 @@ class QP_PT_cleanup_panel(Panel):
             nodegroups_box.label(text=f"Found {duplicate_node_groups} duplicate node groups")
             row = nodegroups_box.row(align=True)
             row.scale_y = 1.5
-            row.operator("cleanup.clean_node_groups", text="Clean Duplicate Node Groups", icon='BRUSH_DATA')
+            op = row.operator("cleanup.analyze_async", text="Clean Duplicate Node Groups", icon='BRUSH_DATA')
+            op.data_type = 'node_groups'
         else:
             nodegroups_box.label(text="No duplicate node groups found", icon='CHECKMARK')
         
@@ -738,7 +740,8 @@ class QP_PT_cleanup_panel(Panel):
             images_box.label(text=f"Found {duplicate_images} duplicate images")
             row = images_box.row(align=True)
             row.scale_y = 1.5
-            row.operator("cleanup.clean_images", text="Clean Duplicate Images", icon='BRUSH_DATA')
+            op = row.operator("cleanup.analyze_async", text="Clean Duplicate Images", icon='BRUSH_DATA')
+            op.data_type = 'images'
         else:
             images_box.label(text="No duplicate images found", icon='CHECKMARK')
 